@@ -1,44 +1,105 @@
 #!/usr/bin/env python3
 """Fix duplicate import blocks."""
 
+import mmap
 import os
-import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Literal byte markers delimiting the full import header block (bytes so
+# they can be searched directly over an mmap without decoding the file)
+BLOCK_START = b'import sys\nimport os\n\n# Add project paths\nPROJECT_ROOT'
+BLOCK_END = b'sys.path.insert(0, SIMULATOR_PATH)\n'
+
+def block_markers(content):
+    """Return (start, end) markers in the file's line-ending style.
+
+    The file is searched as raw bytes, so CRLF files need CRLF markers.
+    """
+    if content.find(b'\r\n') == -1:
+        return BLOCK_START, BLOCK_END
+    return BLOCK_START.replace(b'\n', b'\r\n'), BLOCK_END.replace(b'\n', b'\r\n')
+
+def find_blocks(content, block_start, block_end):
+    """Yield (start, end) spans of each import header block."""
+    start = content.find(block_start)
+    while start != -1:
+        end = content.find(block_end, start)
+        if end == -1:
+            return
+        end += len(block_end)
+        yield start, end
+        start = content.find(block_start, end)
+
+def iter_python_files(directory):
+    """Recursively yield .py file paths using scandir's cached d_type."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_python_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry.path
 
 def fix_file(filepath):
-    """Remove duplicate import blocks."""
-    with open(filepath, 'r') as f:
-        content = f.read()
+    """Return the file content with duplicate import blocks removed, or None."""
+    with open(filepath, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
 
-    # Pattern to match the full import header block
-    import_pattern = r'(import sys\nimport os\n\n# Add project paths\nPROJECT_ROOT.*?sys\.path\.insert\(0, SIMULATOR_PATH\)\n)'
+        # Search the mapping directly instead of copying the file into a
+        # bytes/str object; clean files are never decoded or copied
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            block_start, block_end = block_markers(content)
 
-    # Find all matches
-    matches = list(re.finditer(import_pattern, content, re.DOTALL))
+            # Cheap pre-check: a duplicate needs at least two block terminators
+            first_end = content.find(block_end)
+            if first_end == -1 or content.find(block_end, first_end + 1) == -1:
+                return None
 
-    if len(matches) > 1:
-        print(f"Fixing: {filepath}")
-        # Keep only the first match, remove others
-        for match in reversed(matches[1:]):
-            content = content[:match.start()] + content[match.end():]
+            # Keep only the first block and drop the others while the blocks
+            # are being found (one pass, surviving spans joined once)
+            blocks = find_blocks(content, block_start, block_end)
+            if next(blocks, None) is None:
+                return None
 
-        with open(filepath, 'w') as f:
-            f.write(content)
-        return True
-    return False
+            parts = []
+            kept_from = 0
+            for start, end in blocks:
+                parts.append(content[kept_from:start])
+                kept_from = end
+
+            if not parts:
+                return None
+
+            parts.append(content[kept_from:])
+            return b''.join(parts)
+
+def write_pending(pending):
+    """Write staged {path: content} rewrites in path order."""
+    for filepath in sorted(pending):
+        with open(filepath, 'wb') as f:
+            f.write(pending[filepath])
 
 def main():
     project_root = os.path.dirname(os.path.abspath(__file__))
     simulations_dir = os.path.join(project_root, 'simulations')
 
-    fixed = 0
-    for root, dirs, files in os.walk(simulations_dir):
-        for file in files:
-            if file.endswith('.py'):
-                filepath = os.path.join(root, file)
-                if fix_file(filepath):
-                    fixed += 1
+    filepaths = list(iter_python_files(simulations_dir))
+
+    # Files are independent, so scan them concurrently (mostly I/O bound);
+    # workers only compute the new content and the rewrites are staged
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        results = executor.map(fix_file, filepaths)
+        pending = {filepath: content for filepath, content in zip(filepaths, results)
+                   if content is not None}
+
+    write_pending(pending)
 
-    print(f"\nFixed {fixed} files")
+    # Buffer status lines and emit them with a single write
+    log = [f"Fixing: {filepath}\n" for filepath in filepaths if filepath in pending]
+    log.append(f"\nFixed {len(log)} files\n")
+    sys.stdout.write(''.join(log))
 
 if __name__ == '__main__':
     main()
@@ -3,8 +3,12 @@
 Fix import paths to correctly locate priority_stream_simulator.
 """
 
+import io
 import os
-import re
+import subprocess
+import sys
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
 
 NEW_IMPORT_BLOCK = """import sys
 import os
@@ -21,39 +25,79 @@ sys.path.insert(0, SIMULATOR_PATH)
 
 NEW_PREEMPTIVE_IMPORT_BLOCK = """import sys
 import os
+import pathlib
 
-# Add project paths
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
-sys.path.insert(0, PROJECT_ROOT)
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
-# Add priority stream simulator (in parent directory)
+# Add project paths (this file is three levels below the project root), plus
+# the priority stream simulator's parent directory. Already-present entries
+# are skipped so re-imports (e.g. in worker processes) don't grow sys.path.
+PROJECT_ROOT = str(pathlib.Path(__file__).resolve().parents[3])
 SIMULATOR_PATH = os.path.dirname(PROJECT_ROOT)
-sys.path.insert(0, SIMULATOR_PATH)
+for _path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src'), SIMULATOR_PATH):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 """
 
 
+def find_header_bounds(content):
+    """Return (docstring_end, from_start) offsets found by tokenizing content.
+
+    Either value is None when it cannot be located. Tokenizing (rather than
+    searching for quote and 'from ' substrings) skips over string contents,
+    so a docstring quoting triple quotes or a line starting with 'from '
+    cannot be mistaken for the header boundaries.
+    """
+    # Character offset of the start of each line, to convert token positions
+    line_starts = [0]
+    index = content.find('\n')
+    while index != -1:
+        line_starts.append(index + 1)
+        index = content.find('\n', index + 1)
+
+    docstring_end = None
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(content).readline):
+            if docstring_end is None:
+                if tok.type == tokenize.STRING and tok.start[1] == 0:
+                    row, col = tok.end
+                    docstring_end = line_starts[row - 1] + col
+            elif tok.type == tokenize.NAME and tok.string == 'from' and tok.start[1] == 0:
+                # Stop at the first import; the rest of the file is never tokenized
+                row, col = tok.start
+                return docstring_end, line_starts[row - 1] + col
+    except (tokenize.TokenError, SyntaxError):
+        pass
+    return docstring_end, None
+
+
+def scan_dir(directory):
+    """Return (subdirectory names, set of file names) from a single scandir pass."""
+    dirs, files = [], set()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                dirs.append(entry.name)
+            elif entry.is_file():
+                files.add(entry.name)
+    return dirs, files
+
+
 def fix_file(filepath, is_preemptive=False):
-    """Fix imports in a file."""
+    """Return (fixed content or None if unchanged, warning line or None).
+
+    Warnings are returned rather than printed so that, with files fixed
+    concurrently, they can be logged under the file they refer to.
+    """
     with open(filepath, 'r') as f:
         content = f.read()
 
-    # Find the docstring
-    docstring_match = re.search(r'^"""[\s\S]*?"""', content, re.MULTILINE)
-    if not docstring_match:
-        print(f"  WARNING: No docstring in {filepath}")
-        return False
-
-    docstring_end = docstring_match.end()
+    # Find the end of the docstring and the first "from" import
+    # (this is where actual imports begin) in one tokenizer pass
+    docstring_end, from_start = find_header_bounds(content)
+    if docstring_end is None:
+        return None, f"  WARNING: No docstring in {filepath}\n"
 
-    # Find where imports start (after docstring)
-    remaining = content[docstring_end:]
-
-    # Find the first "from" import (this is where actual imports begin)
-    from_match = re.search(r'^from ', remaining, re.MULTILINE)
-    if not from_match:
-        print(f"  WARNING: No 'from' imports found in {filepath}")
-        return False
+    if from_start is None:
+        return None, f"  WARNING: No 'from' imports found in {filepath}\n"
 
     # Replace everything between docstring and first 'from' import
     new_content = (
@@ -61,13 +105,21 @@ def fix_file(filepath, is_preemptive=False):
         "\n\n" +
         (NEW_PREEMPTIVE_IMPORT_BLOCK if is_preemptive else NEW_IMPORT_BLOCK) +
         "\n" +
-        remaining[from_match.start():]
+        content[from_start:]
     )
 
-    with open(filepath, 'w') as f:
-        f.write(new_content)
+    # Leave files that already have the right header untouched
+    if new_content == content:
+        return None, None
+
+    return new_content, None
 
-    return True
+
+def write_pending(pending):
+    """Write staged {path: content} rewrites in path order."""
+    for filepath in sorted(pending):
+        with open(filepath, 'w') as f:
+            f.write(pending[filepath])
 
 
 def main():
@@ -77,47 +129,78 @@ def main():
 
     files_to_fix = []
 
-    # Find all Python files
-    for topology in os.listdir(simulations_dir):
+    # Find all Python files (one scandir per directory instead of a stat per path;
+    # file paths are built by prefix concatenation rather than os.path.join)
+    topologies, _ = scan_dir(simulations_dir)
+    for topology in topologies:
         topology_dir = os.path.join(simulations_dir, topology)
-        if not os.path.isdir(topology_dir):
-            continue
+        subdirs, _ = scan_dir(topology_dir)
 
         # Scenarios
-        scenarios_dir = os.path.join(topology_dir, 'scenarios')
-        if os.path.exists(scenarios_dir):
+        if 'scenarios' in subdirs:
+            scenarios_dir = os.path.join(topology_dir, 'scenarios')
+            _, present = scan_dir(scenarios_dir)
+            scenarios_prefix = scenarios_dir + os.sep
             for fname in ['run_experiment.py', 'analyze_results.py']:
-                fpath = os.path.join(scenarios_dir, fname)
-                if os.path.exists(fpath):
-                    files_to_fix.append((fpath, False))
+                if fname in present:
+                    files_to_fix.append((scenarios_prefix + fname, False))
 
         # Preemptive
-        preemptive_dir = os.path.join(topology_dir, 'preemptive')
-        if os.path.exists(preemptive_dir):
+        if 'preemptive' in subdirs:
+            preemptive_dir = os.path.join(topology_dir, 'preemptive')
+            _, present = scan_dir(preemptive_dir)
+            preemptive_prefix = preemptive_dir + os.sep
             for fname in ['run_preemptive_experiments.py', 'analyze_preemption.py']:
-                fpath = os.path.join(preemptive_dir, fname)
-                if os.path.exists(fpath):
-                    files_to_fix.append((fpath, True))
+                if fname in present:
+                    files_to_fix.append((preemptive_prefix + fname, True))
 
     print(f"Fixing {len(files_to_fix)} files...\n")
 
+    # Files are independent, so scan them concurrently (mostly I/O bound);
+    # workers only compute the new content and the rewrites are staged
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        results = list(executor.map(lambda args: fix_file(*args), files_to_fix))
+        pending = {filepath: content for (filepath, _), (content, _) in zip(files_to_fix, results)
+                   if content is not None}
+
+    write_pending(pending)
+
+    # Buffer status lines and emit them with a single write
+    log = []
     fixed = 0
-    for filepath, is_preemptive in files_to_fix:
-        print(f"Fixing: {filepath}")
-        if fix_file(filepath, is_preemptive):
+    for (filepath, _), (_, warning) in zip(files_to_fix, results):
+        log.append(f"Fixing: {filepath}\n")
+        if warning:
+            log.append(warning)
+        if filepath in pending:
             fixed += 1
-            print(f"  ✓ Fixed")
-        print()
-
-    print(f"\n{'='*70}")
-    print(f"Fixed {fixed}/{len(files_to_fix)} files")
-    print(f"{'='*70}\n")
-
-    # Test import
-    print("Testing import...")
-    test_file = os.path.join(simulations_dir, 'tree_topology/scenarios/run_experiment.py')
-    if os.path.exists(test_file):
-        os.system(f'cd {os.path.dirname(test_file)} && python3 -c "import run_experiment; print(\\"✓ Import successful!\\")" 2>&1 | head -5')
+            log.append("  ✓ Fixed\n")
+        log.append("\n")
+
+    log.append(f"\n{'='*70}\n")
+    log.append(f"Fixed {fixed}/{len(files_to_fix)} files\n")
+    log.append(f"{'='*70}\n\n")
+    sys.stdout.write(''.join(log))
+
+    # Test import (opt-in: spawns an interpreter and imports the simulator)
+    if '--verify' in sys.argv:
+        print("Testing import...")
+        test_file = os.path.join(simulations_dir, 'tree_topology/scenarios/run_experiment.py')
+        if os.path.exists(test_file):
+            try:
+                result = subprocess.run(
+                    [sys.executable, '-c', 'import run_experiment'],
+                    cwd=os.path.dirname(test_file),
+                    capture_output=True, text=True, timeout=10
+                )
+            except subprocess.TimeoutExpired:
+                print("  WARNING: Import test timed out")
+            else:
+                if result.returncode == 0:
+                    print("✓ Import successful!")
+                else:
+                    lines = result.stderr.strip().splitlines()
+                    print(f"  WARNING: Import failed: {lines[-1] if lines else result.returncode}")
 
 
 if __name__ == '__main__':
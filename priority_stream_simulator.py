@@ -9,34 +9,82 @@ Extended discrete-event network simulator with:
 
 import heapq
 import csv
+import gc
+from array import array
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 from collections import deque, defaultdict
 import time
+from functools import cached_property
 
+try:
+    import numpy as np
+except ImportError:  # statistics fall back to pure Python
+    np = None
 
-@dataclass(order=True)
-class Event:
+
+_plt = None
+
+
+def _pyplot():
     """
-    Simulation event with priority ordering by time.
+    Import pyplot on first use, selecting the non-interactive Agg backend.
 
-    Attributes:
-        time: Event timestamp (simulation time in seconds)
-        priority: Used to break ties when events have same time
-        action: Callable to execute when event fires
-        description: Human-readable event description
+    The visualize_* methods only write image files, so no GUI toolkit is
+    ever initialized; the backend is selected once per process.
     """
-    time: float
-    priority: int = 0
-    action: object = field(compare=False, default=None)
-    description: str = field(compare=False, default="")
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg', force=True)
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
+
+_PRIORITY_COLORS = None
+
+
+def _priority_colors():
+    """RdYlGn RGBA rows indexed by priority level (0-7), computed once per process."""
+    global _PRIORITY_COLORS
+    if _PRIORITY_COLORS is None:
+        _PRIORITY_COLORS = _pyplot().cm.RdYlGn(np.linspace(0, 1, 8))
+    return _PRIORITY_COLORS
+
 
+def _column_delays(arrivals: array, creations: array):
+    """Per-message delays from arrival/creation time columns (ndarray with NumPy)."""
+    if np is not None:
+        return np.frombuffer(arrivals, dtype=np.float64) - np.frombuffer(creations, dtype=np.float64)
+    return [arrival - creation for arrival, creation in zip(arrivals, creations)]
 
-@dataclass
+
+def _summarize_delays(delays) -> Tuple[float, float, float]:
+    """Return (mean, min, max) of a non-empty delay sequence."""
+    if np is not None:
+        return float(delays.mean()), float(delays.min()), float(delays.max())
+    return sum(delays) / len(delays), min(delays), max(delays)
+
+
+def _mean_jitter(delays) -> float:
+    """Mean absolute difference between consecutive delays (0 if fewer than two)."""
+    if len(delays) < 2:
+        return 0
+    if np is not None:
+        return float(np.abs(np.diff(delays)).mean())
+    jitter_values = [abs(delays[i] - delays[i-1]) for i in range(1, len(delays))]
+    return sum(jitter_values) / len(jitter_values)
+
+
+@dataclass(slots=True, frozen=True)
 class Stream:
     """
     Traffic stream with priority.
 
+    Streams are immutable once created, so they are hashable and can be
+    shared or used as dictionary keys.
+
     Attributes:
         stream_id: Unique stream identifier
         priority: Priority level (0-7, where 7 is highest)
@@ -53,14 +101,16 @@ class Stream:
     message_interval_sec: float
     message_size_bytes: int
     description: str = ""
+    size_bits: int = field(init=False, repr=False, compare=False)  # Cached message size in bits
 
     def __post_init__(self):
         """Validate priority level."""
         if not 0 <= self.priority <= 7:
             raise ValueError(f"Priority must be between 0 and 7, got {self.priority}")
+        object.__setattr__(self, 'size_bits', self.message_size_bytes * 8)
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """
     Network message/packet with stream and timing information.
@@ -107,6 +157,8 @@ class Link:
     with realistic bandwidth constraints and propagation delay.
     """
 
+    __slots__ = ('name', 'bandwidth_bps', 'delay_sec', 'busy_until')
+
     def __init__(self, name: str, bandwidth_mbps: float, delay_ms: float):
         """
         Initialize a network link.
@@ -130,21 +182,30 @@ class Link:
         """Check if link is currently transmitting."""
         return current_time < self.busy_until
 
-    def start_transmission(self, current_time: float, size_bytes: int) -> float:
+    def start_transmission(self, current_time: float, size_bytes: int,
+                           transmission_time: Optional[float] = None) -> Tuple[float, float]:
         """
         Start transmitting a message.
 
+        Args:
+            current_time: Current simulation time
+            size_bytes: Message size in bytes
+            transmission_time: Precomputed transmission time (computed from
+                size_bytes if not given)
+
         Returns:
-            Time when message will arrive at other end of link
+            (start_time, arrival_time): when transmission begins on the link
+            and when the message will arrive at the other end
         """
         # Wait if link is busy
         start_time = max(current_time, self.busy_until)
-        transmission_time = self.get_transmission_time(size_bytes)
+        if transmission_time is None:
+            transmission_time = self.get_transmission_time(size_bytes)
         self.busy_until = start_time + transmission_time
 
         # Total time = transmission + propagation delay
         arrival_time = self.busy_until + self.delay_sec
-        return arrival_time
+        return start_time, arrival_time
 
 
 class PriorityQueue:
@@ -160,14 +221,19 @@ class PriorityQueue:
 
     def __init__(self):
         """Initialize 8 priority queues."""
-        self.queues: Dict[int, deque] = {i: deque() for i in range(8)}
+        # Indexed directly by priority level (a list avoids hashing per access)
+        self.queues: List[deque] = [deque() for _ in range(8)]
         self.total_size = 0
+        # Bit p is set iff queue p is non-empty, so the highest/lowest
+        # non-empty level is found with bit tricks instead of a scan
+        self.nonempty = 0
 
     def enqueue(self, message: Message, output_port: str):
         """Add message to appropriate priority queue."""
         priority = message.priority
         self.queues[priority].append((message, output_port))
         self.total_size += 1
+        self.nonempty |= 1 << priority
 
     def dequeue(self) -> Optional[Tuple[Message, str]]:
         """
@@ -176,12 +242,17 @@ class PriorityQueue:
         Returns:
             (message, output_port) tuple, or None if all queues empty
         """
-        # Check from highest priority (7) to lowest (0)
-        for priority in range(7, -1, -1):
-            if self.queues[priority]:
-                self.total_size -= 1
-                return self.queues[priority].popleft()
-        return None
+        if not self.nonempty:
+            return None
+
+        # Highest set bit is the highest non-empty priority
+        priority = self.nonempty.bit_length() - 1
+        queue = self.queues[priority]
+        entry = queue.popleft()
+        if not queue:
+            self.nonempty &= ~(1 << priority)
+        self.total_size -= 1
+        return entry
 
     def get_lowest_priority_message(self) -> Optional[Tuple[int, Message, str]]:
         """
@@ -190,13 +261,14 @@ class PriorityQueue:
         Returns:
             (priority, message, output_port) tuple, or None if queue empty
         """
-        # Check from lowest priority (0) to highest (7)
-        for priority in range(0, 8):
-            if self.queues[priority]:
-                # Return but don't remove
-                message, output_port = self.queues[priority][-1]  # Get last (oldest in this priority)
-                return (priority, message, output_port)
-        return None
+        if not self.nonempty:
+            return None
+
+        # Lowest set bit is the lowest non-empty priority
+        priority = (self.nonempty & -self.nonempty).bit_length() - 1
+        # Return but don't remove
+        message, output_port = self.queues[priority][-1]  # Get last (oldest in this priority)
+        return (priority, message, output_port)
 
     def drop_lowest_priority_message(self) -> Optional[Message]:
         """
@@ -206,17 +278,21 @@ class PriorityQueue:
         Returns:
             Dropped message, or None if queue empty
         """
-        # Check from lowest priority (0) to highest (7)
-        for priority in range(0, 8):
-            if self.queues[priority]:
-                message, _ = self.queues[priority].pop()  # Remove last (FIFO tail drop)
-                self.total_size -= 1
-                return message
-        return None
+        if not self.nonempty:
+            return None
+
+        # Lowest set bit is the lowest non-empty priority
+        priority = (self.nonempty & -self.nonempty).bit_length() - 1
+        queue = self.queues[priority]
+        message, _ = queue.pop()  # Remove last (FIFO tail drop)
+        if not queue:
+            self.nonempty &= ~(1 << priority)
+        self.total_size -= 1
+        return message
 
     def is_empty(self) -> bool:
         """Check if all priority queues are empty."""
-        return self.total_size == 0
+        return self.nonempty == 0
 
     def get_queue_lengths(self) -> Dict[int, int]:
         """Get length of each priority queue."""
@@ -318,8 +394,13 @@ class Switch:
                     self.network.track_dropped_message(message)
                     return
 
-        # Enqueue message in appropriate priority queue
-        self.priority_queue.enqueue(message, output_port)
+        # Enqueue message in appropriate priority queue (PriorityQueue.enqueue
+        # inlined on this per-packet path)
+        queue = self.priority_queue
+        priority = message.priority
+        queue.queues[priority].append((message, output_port))
+        queue.total_size += 1
+        queue.nonempty |= 1 << priority
 
         # Try to forward if not currently transmitting
         if not self.is_transmitting:
@@ -327,18 +408,22 @@ class Switch:
 
     def forward_next_message(self, current_time: float):
         """Forward the next highest-priority message in the queue."""
-        if self.priority_queue.is_empty():
+        queue = self.priority_queue
+        nonempty = queue.nonempty
+        if not nonempty:
             self.is_transmitting = False
             return
 
         self.is_transmitting = True
-        result = self.priority_queue.dequeue()
-
-        if result is None:
-            self.is_transmitting = False
-            return
 
-        message, output_port = result
+        # Serve the highest non-empty priority level (PriorityQueue.dequeue
+        # inlined on this per-packet path)
+        priority = nonempty.bit_length() - 1
+        level = queue.queues[priority]
+        message, output_port = level.popleft()
+        if not level:
+            queue.nonempty = nonempty & ~(1 << priority)
+        queue.total_size -= 1
 
         # Get the output link
         link = self.output_links.get(output_port)
@@ -348,23 +433,28 @@ class Switch:
             return
 
         # Start transmission on the link
-        arrival_time = link.start_transmission(current_time, message.size_bytes)
+        _, arrival_time = link.start_transmission(current_time, message.size_bytes)
         self.messages_forwarded += 1
 
         # Schedule message arrival at destination
         self.network.schedule_event(
             arrival_time,
-            lambda: self.network.deliver_message(message, output_port),
-            f"Message {message.msg_id} (stream {message.stream_id}, pri {message.priority}) arrives at {output_port}"
+            self.network.deliver_message, (message, output_port),
+            "Message {0.msg_id} (stream {0.stream_id}, pri {0.priority}) arrives at {1}"
         )
 
         # Schedule next forwarding attempt
         self.network.schedule_event(
             link.busy_until,
-            lambda: self.forward_next_message(link.busy_until),
-            f"Switch {self.name} ready for next message"
+            self._link_available, (link,),
+            "Switch {owner.name} ready for next message"
         )
 
+    def _link_available(self, link: Link):
+        """Forward the next message once the output link is free."""
+        # Read busy_until when the event fires, not when it was scheduled
+        self.forward_next_message(link.busy_until)
+
     def get_queue_statistics(self) -> Dict:
         """Get current queue statistics."""
         return {
@@ -395,15 +485,19 @@ class Node:
         self.name = name
         self.network = network
         self.output_link: Optional[Link] = None
+        self._next_hop: Optional[str] = None  # First hop (typically a switch), if any
 
         # Stream management
         self.streams: Dict[int, Stream] = {}
-        self.stream_seq_nums: Dict[int, int] = defaultdict(int)
+        self.stream_seq_nums: Dict[int, int] = {}
+        # stream_id -> (stream, first-hop destination), resolved once per stream
+        self._routes: Dict[int, Tuple[Stream, str]] = {}
 
         # Statistics
         self.messages_sent = 0
-        self.messages_sent_by_stream: Dict[int, int] = defaultdict(int)
+        self.messages_sent_by_stream: Dict[int, int] = {}  # Filled in add_stream
         self.messages_received: List[Message] = []
+        # Received streams originate elsewhere and are not known in advance
         self.messages_received_by_stream: Dict[int, List[Message]] = defaultdict(list)
 
     def set_output_link(self, link: Link):
@@ -418,64 +512,66 @@ class Node:
             stream: Stream configuration
             start_time: When to start generating traffic
         """
+        self.network.schedule_event(*self._register_stream(stream, start_time))
+
+    def add_streams(self, streams: List[Stream], start_time: float = 0.0):
+        """
+        Add several traffic streams to this node, scheduling them in one batch.
+
+        Args:
+            streams: Stream configurations, started in this order
+            start_time: When to start generating traffic
+        """
+        self.network.schedule_events([self._register_stream(stream, start_time) for stream in streams])
+
+    def _register_stream(self, stream: Stream, start_time: float) -> Tuple[float, object, tuple, str]:
+        """Set up per-stream state and return the stream's first-message event."""
         if stream.src_node != self.name:
             raise ValueError(f"Stream source {stream.src_node} doesn't match node {self.name}")
 
         self.streams[stream.stream_id] = stream
         self.stream_seq_nums[stream.stream_id] = 0
+        self.messages_sent_by_stream[stream.stream_id] = 0
+        self._routes[stream.stream_id] = (stream, self._first_hop(stream))
 
-        # Schedule first message
-        self.network.schedule_event(
-            start_time,
-            lambda sid=stream.stream_id: self.generate_message(sid, start_time),
-            f"Node {self.name} generates first message for stream {stream.stream_id}"
-        )
+        # First message event
+        return (start_time,
+                self.generate_message, (stream.stream_id, start_time),
+                "Node {owner.name} generates first message for stream {0}")
 
     def generate_message(self, stream_id: int, current_time: float):
         """Generate and send a message for a specific stream."""
-        if self.output_link is None:
+        link = self.output_link
+        if link is None:
             return
 
-        stream = self.streams.get(stream_id)
-        if stream is None:
+        route = self._routes.get(stream_id)
+        if route is None:
             return
+        # Destination of the first hop (switch or node), resolved in add_stream
+        stream, destination = route
 
-        # Create message
+        # Create message (positional, in Message field order)
         seq_num = self.stream_seq_nums[stream_id]
         message = Message(
-            msg_id=self.network.get_next_message_id(),
-            stream_id=stream_id,
-            seq_num=seq_num,
-            priority=stream.priority,
-            src_node=self.name,
-            dst_node=stream.dst_node,
-            size_bytes=stream.message_size_bytes,
-            creation_time=current_time
+            self.network.get_next_message_id(), stream_id, seq_num, stream.priority,
+            self.name, stream.dst_node, stream.message_size_bytes, current_time
         )
         self.stream_seq_nums[stream_id] += 1
         self.messages_sent += 1
         self.messages_sent_by_stream[stream_id] += 1
 
-        # Send on output link
-        arrival_time = self.output_link.start_transmission(
-            current_time, message.size_bytes
-        )
-        message.transmission_start_time = max(
-            current_time,
-            self.output_link.busy_until - self.output_link.get_transmission_time(message.size_bytes)
+        # Send on output link (transmission time computed once per message)
+        transmission_time = stream.size_bits / link.bandwidth_bps
+        message.transmission_start_time, arrival_time = link.start_transmission(
+            current_time, message.size_bytes, transmission_time
         )
 
         # Schedule arrival at next hop
-        # We need to determine the destination (switch or node)
-        destination = stream.dst_node
-        # If there's a switch in between, route to switch first
-        if hasattr(self, '_next_hop'):
-            destination = self._next_hop
-
         self.network.schedule_event(
             arrival_time,
-            lambda: self.network.deliver_message(message, destination),
-            f"Message {message.msg_id} from stream {stream_id} arrives at {destination}"
+            self.network.deliver_message, (message, destination),
+            "Message {0.msg_id} from stream {0.stream_id} arrives at {1}"
         )
 
         # Schedule next message generation
@@ -483,8 +579,8 @@ class Node:
         if next_time < self.network.sim_duration:
             self.network.schedule_event(
                 next_time,
-                lambda sid=stream_id: self.generate_message(sid, next_time),
-                f"Node {self.name} generates message for stream {stream_id}"
+                self.generate_message, (stream_id, next_time),
+                "Node {owner.name} generates message for stream {0}"
             )
 
     def receive_message(self, message: Message, current_time: float):
@@ -496,6 +592,13 @@ class Node:
     def set_next_hop(self, next_hop: str):
         """Set the next hop for routing (typically a switch)."""
         self._next_hop = next_hop
+        # Re-resolve the first hop of streams added before the next hop was set
+        for stream_id, (stream, _) in self._routes.items():
+            self._routes[stream_id] = (stream, self._first_hop(stream))
+
+    def _first_hop(self, stream: Stream) -> str:
+        """Destination of a stream's first hop: the next hop (switch) if set, else the stream's destination."""
+        return self._next_hop if self._next_hop is not None else stream.dst_node
 
 
 class Network:
@@ -505,16 +608,20 @@ class Network:
     Manages the event queue, network topology, streams, and simulation execution.
     """
 
-    def __init__(self, sim_duration: float):
+    def __init__(self, sim_duration: float, debug: bool = False):
         """
         Initialize the network simulator.
 
         Args:
             sim_duration: Total simulation time in seconds
+            debug: Print a description of every event as it fires
         """
         self.sim_duration = sim_duration
+        self.debug = debug
         self.current_time = 0.0
-        self.event_queue: List[Event] = []
+        # Events are (time, counter, action, args, description) tuples; the
+        # counter breaks ties between same-time events in scheduling order
+        self.event_queue: List[Tuple[float, int, object, tuple, str]] = []
         self.event_counter = 0  # For event priority ordering
         self.message_id_counter = 0
 
@@ -526,7 +633,28 @@ class Network:
         # Collected messages for logging
         self.completed_messages: List[Message] = []
         self.dropped_messages: List[Message] = []
-        self.completed_by_stream: Dict[int, List[Message]] = defaultdict(list)
+        self.drops_by_stream: Dict[int, int] = {}
+        self.completed_by_stream: Dict[int, List[Message]] = {}
+
+        # Per-stream delivery metrics stored column-wise (contiguous arrays)
+        # so statistics do not walk Message objects
+        self.arrival_times_by_stream: Dict[int, array] = {}
+        self.creation_times_by_stream: Dict[int, array] = {}
+        self.sizes_by_stream: Dict[int, array] = {}
+        # stream_id -> (completed, arrivals, creations, sizes) for one lookup per delivery
+        self._stream_columns: Dict[int, Tuple[List[Message], array, array, array]] = {}
+
+        # Per-stream statistics cache, keyed by (delivered, dropped) counts
+        self._stream_stats: Dict[int, Dict] = {}
+        self._stream_stats_key: Optional[Tuple[int, int]] = None
+
+        # Figures reused across visualize calls (created lazily, freed by close())
+        self._fig_stream = None
+        self._axes_stream = None
+        self._fig_timeseries = None
+        self._ax_timeseries = None
+        # figure role -> (tick layout key, subplots_adjust params) from tight_layout
+        self._layouts: Dict[str, Tuple[tuple, Dict[str, float]]] = {}
 
     def get_next_message_id(self) -> int:
         """Get next unique message ID."""
@@ -549,17 +677,73 @@ class Network:
     def add_stream(self, stream: Stream):
         """Register a stream in the network."""
         self.streams[stream.stream_id] = stream
+        if stream.stream_id not in self._stream_columns:
+            self._add_stream_columns(stream.stream_id)
+        # Invalidate the plotting order and statistics cached from the
+        # previous stream set
+        self.__dict__.pop('_streams_by_priority', None)
+        self._stream_stats_key = None
+
+    @cached_property
+    def _streams_by_priority(self) -> List[Tuple[int, Stream]]:
+        """Registered streams sorted by priority (highest first), for plotting."""
+        return sorted(self.streams.items(), key=lambda x: x[1].priority, reverse=True)
+
+    def add_streams(self, streams: List[Stream]):
+        """Register several streams in the network."""
+        for stream in streams:
+            self.add_stream(stream)
+
+    def start_streams(self, streams: List[Stream], start_time: float = 0.0):
+        """
+        Start streams on their source nodes, scheduling them in one batch.
 
-    def schedule_event(self, time: float, action, description: str = ""):
-        """Schedule a new event."""
-        event = Event(
-            time=time,
-            priority=self.event_counter,
-            action=action,
-            description=description
-        )
+        Equivalent to calling add_stream on each stream's source node in
+        order, but the first-message events are added with a single heapify.
+        """
+        nodes = self.nodes
+        self.schedule_events([nodes[stream.src_node]._register_stream(stream, start_time)
+                              for stream in streams])
+
+    def _add_stream_columns(self, stream_id: int) -> Tuple[List[Message], array, array, array]:
+        """Allocate the per-stream message list and metric columns."""
+        columns = ([], array('d'), array('d'), array('q'))
+        (self.completed_by_stream[stream_id], self.arrival_times_by_stream[stream_id],
+         self.creation_times_by_stream[stream_id], self.sizes_by_stream[stream_id]) = columns
+        self.drops_by_stream.setdefault(stream_id, 0)
+        self._stream_columns[stream_id] = columns
+        return columns
+
+    def schedule_event(self, time: float, action, args: tuple = (), description: str = ""):
+        """
+        Schedule a new event.
+
+        The action is called as action(*args) when the event fires, so bound
+        methods can be scheduled directly without allocating a closure.
+
+        The description is a str.format template over args (plus {owner},
+        the object of a bound-method action). It is only formatted in debug
+        mode, so scheduling never builds a string.
+        """
+        heapq.heappush(self.event_queue, (time, self.event_counter, action, args, description))
         self.event_counter += 1
-        heapq.heappush(self.event_queue, event)
+
+    def schedule_events(self, events):
+        """
+        Schedule a batch of (time, action, args, description) events.
+
+        Events get consecutive counters in the given order, so they fire
+        exactly as if scheduled one by one; the queue is re-heapified once
+        instead of pushing each event.
+        """
+        counter = self.event_counter
+        batch = [(time, counter + i, action, args, description)
+                 for i, (time, action, args, description) in enumerate(events)]
+        if not batch:
+            return
+        self.event_queue.extend(batch)
+        heapq.heapify(self.event_queue)
+        self.event_counter = counter + len(batch)
 
     def deliver_message(self, message: Message, destination: str):
         """Deliver a message to its destination (node or switch)."""
@@ -570,43 +754,145 @@ class Network:
             # Message arrives at destination node
             self.nodes[destination].receive_message(message, self.current_time)
             self.completed_messages.append(message)
-            self.completed_by_stream[message.stream_id].append(message)
+
+            # Streams registered with add_stream are pre-allocated; others
+            # (not registered with the network) get their columns here
+            columns = self._stream_columns.get(message.stream_id)
+            if columns is None:
+                columns = self._add_stream_columns(message.stream_id)
+            completed, arrivals, creations, sizes = columns
+            completed.append(message)
+            arrivals.append(message.arrival_time)
+            creations.append(message.creation_time)
+            sizes.append(message.size_bytes)
         else:
             print(f"Warning: Unknown destination {destination}")
 
     def track_dropped_message(self, message: Message):
         """Track a dropped message."""
         self.dropped_messages.append(message)
+        self.drops_by_stream[message.stream_id] = self.drops_by_stream.get(message.stream_id, 0) + 1
 
     def run(self):
         """Execute the simulation."""
         print(f"Starting simulation (duration: {self.sim_duration}s)...")
         start_wall_time = time.time()
 
+        # Hot loop: bind the queue, heappop and duration to locals so each
+        # event skips the attribute/global lookups
+        event_queue = self.event_queue
+        heappop = heapq.heappop
+        sim_duration = self.sim_duration
+        debug = self.debug
+
         events_processed = 0
-        while self.event_queue and self.current_time < self.sim_duration:
-            event = heapq.heappop(self.event_queue)
+        current_time = self.current_time
 
-            if event.time > self.sim_duration:
-                break
+        # Every message is retained (for export and statistics), so the
+        # cyclic GC would keep re-traversing the growing message lists while
+        # events fire; the loop itself creates no reference cycles
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            while event_queue and current_time < sim_duration:
+                event_time, _, action, args, description = heappop(event_queue)
+
+                if event_time > sim_duration:
+                    break
 
-            self.current_time = event.time
+                self.current_time = current_time = event_time
 
-            # Execute event action
-            if event.action is not None:
-                event.action()
+                if debug and description:
+                    owner = getattr(action, '__self__', None)
+                    print(f"[{event_time:.6f}s] {description.format(*args, owner=owner)}")
 
-            events_processed += 1
+                # Execute event action
+                if action is not None:
+                    action(*args)
+
+                events_processed += 1
+        finally:
+            if gc_was_enabled:
+                gc.enable()
 
         wall_time = time.time() - start_wall_time
         print(f"Simulation completed: {events_processed} events in {wall_time:.3f}s")
         print(f"Final simulation time: {self.current_time:.6f}s")
 
+    def compute_all_stream_stats(self) -> Dict[int, Dict]:
+        """
+        Calculate statistics for every registered stream.
+
+        The result is cached and only recomputed once more messages have
+        been delivered or dropped.
+        """
+        key = (len(self.completed_messages), len(self.dropped_messages))
+        if key != self._stream_stats_key:
+            self._stream_stats = {
+                stream_id: self._compute_stream_statistics(stream_id)
+                for stream_id in self.streams
+            }
+            self._stream_stats_key = key
+        return self._stream_stats
+
     def get_stream_statistics(self, stream_id: int) -> Dict:
+        """Get statistics for a specific stream."""
+        all_stats = self.compute_all_stream_stats()
+        if stream_id in all_stats:
+            return all_stats[stream_id]
+        return self._compute_stream_statistics(stream_id)
+
+    def get_stream_statistics_bulk(self, stream_ids) -> Dict[str, object]:
+        """
+        Get delivery/drop/delay statistics for several streams as columns.
+
+        Columns follow the order of stream_ids and are NumPy arrays when NumPy
+        is available, otherwise lists. Streams without deliveries have a
+        mean delay of 0.
+
+        Returns:
+            Dict with 'total_messages', 'dropped_messages' and 'mean_delay_ms' columns
+        """
+        rows = [self.get_stream_statistics(stream_id) for stream_id in stream_ids]
+
+        column = np.asarray if np is not None else list
+        return {
+            'total_messages': column([stats['total_messages'] for stats in rows]),
+            'dropped_messages': column([stats['dropped_messages'] for stats in rows]),
+            'mean_delay_ms': column([stats.get('mean_delay_ms', 0.0) for stats in rows]),
+        }
+
+    def get_all_stream_statistics(self) -> Dict[str, object]:
+        """
+        Get per-stream statistics as columns, one entry per stream with deliveries.
+
+        Streams are ordered by priority (highest first). Columns are NumPy
+        arrays when NumPy is available, otherwise lists.
+
+        Returns:
+            Dict with 'stream_ids', 'priorities', 'total_messages', 'drops',
+            'mean_delay_ms', 'mean_jitter_ms' and 'throughput_mbps' columns
+        """
+        all_stats = self.compute_all_stream_stats()
+        rows = [all_stats[stream_id] for stream_id, _ in self._streams_by_priority
+                if all_stats[stream_id]['total_messages'] > 0]
+
+        column = np.asarray if np is not None else list
+        return {
+            'stream_ids': column([stats['stream_id'] for stats in rows]),
+            'priorities': column([stats['priority'] for stats in rows]),
+            'total_messages': column([stats['total_messages'] for stats in rows]),
+            'drops': column([stats['dropped_messages'] for stats in rows]),
+            'mean_delay_ms': column([stats['mean_delay_ms'] for stats in rows]),
+            'mean_jitter_ms': column([stats['mean_jitter_ms'] for stats in rows]),
+            'throughput_mbps': column([stats['throughput_mbps'] for stats in rows]),
+        }
+
+    def _compute_stream_statistics(self, stream_id: int) -> Dict:
         """Calculate statistics for a specific stream."""
-        messages = self.completed_by_stream.get(stream_id, [])
+        arrivals = self.arrival_times_by_stream.get(stream_id)
 
-        if not messages:
+        if not arrivals:
             return {
                 'stream_id': stream_id,
                 'priority': self.streams[stream_id].priority if stream_id in self.streams else None,
@@ -614,43 +900,32 @@ class Network:
                 'dropped_messages': 0
             }
 
-        delays = [msg.get_end_to_end_delay() for msg in messages]
-        delays = [d for d in delays if d is not None]
-
-        if not delays:
-            return {
-                'stream_id': stream_id,
-                'priority': self.streams[stream_id].priority,
-                'total_messages': len(messages),
-                'dropped_messages': 0
-            }
+        # Every delivered message has an arrival time, so no None filtering
+        creations = self.creation_times_by_stream[stream_id]
+        delays = _column_delays(arrivals, creations)
+        mean_delay, min_delay, max_delay = _summarize_delays(delays)
 
         # Calculate jitter
-        jitter_values = []
-        for i in range(1, len(delays)):
-            jitter = abs(delays[i] - delays[i-1])
-            jitter_values.append(jitter)
+        mean_jitter = _mean_jitter(delays)
 
         # Calculate throughput (bytes/sec)
-        if messages:
-            time_span = messages[-1].arrival_time - messages[0].creation_time
-            total_bytes = sum(msg.size_bytes for msg in messages)
-            throughput_mbps = (total_bytes * 8 / time_span / 1_000_000) if time_span > 0 else 0
-        else:
-            throughput_mbps = 0
+        time_span = arrivals[-1] - creations[0]
+        sizes = self.sizes_by_stream[stream_id]
+        total_bytes = int(np.frombuffer(sizes, dtype=np.int64).sum()) if np is not None else sum(sizes)
+        throughput_mbps = (total_bytes * 8 / time_span / 1_000_000) if time_span > 0 else 0
 
         # Count drops for this stream
-        drops = sum(1 for msg in self.dropped_messages if msg.stream_id == stream_id)
+        drops = self.drops_by_stream.get(stream_id, 0)
 
         stats = {
             'stream_id': stream_id,
             'priority': self.streams[stream_id].priority,
-            'total_messages': len(messages),
+            'total_messages': len(arrivals),
             'dropped_messages': drops,
-            'mean_delay_ms': sum(delays) / len(delays) * 1000,
-            'min_delay_ms': min(delays) * 1000,
-            'max_delay_ms': max(delays) * 1000,
-            'mean_jitter_ms': (sum(jitter_values) / len(jitter_values) * 1000) if jitter_values else 0,
+            'mean_delay_ms': mean_delay * 1000,
+            'min_delay_ms': min_delay * 1000,
+            'max_delay_ms': max_delay * 1000,
+            'mean_jitter_ms': mean_jitter * 1000,
             'throughput_mbps': throughput_mbps
         }
 
@@ -658,79 +933,85 @@ class Network:
 
     def get_global_statistics(self) -> Dict:
         """Calculate global network statistics."""
-        all_delays = []
-        for messages in self.completed_by_stream.values():
-            delays = [msg.get_end_to_end_delay() for msg in messages]
-            all_delays.extend([d for d in delays if d is not None])
+        stream_delays = [
+            _column_delays(arrivals, self.creation_times_by_stream[stream_id])
+            for stream_id, arrivals in self.arrival_times_by_stream.items()
+        ]
+        if np is not None:
+            all_delays = np.concatenate(stream_delays) if stream_delays else np.empty(0)
+        else:
+            all_delays = [delay for delays in stream_delays for delay in delays]
 
-        if not all_delays:
+        if len(all_delays) == 0:
             return {}
 
+        mean_delay, min_delay, max_delay = _summarize_delays(all_delays)
+
         stats = {
             'total_messages_delivered': len(self.completed_messages),
             'total_messages_dropped': len(self.dropped_messages),
             'total_streams': len(self.streams),
-            'mean_delay_ms': sum(all_delays) / len(all_delays) * 1000,
-            'min_delay_ms': min(all_delays) * 1000,
-            'max_delay_ms': max(all_delays) * 1000,
+            'mean_delay_ms': mean_delay * 1000,
+            'min_delay_ms': min_delay * 1000,
+            'max_delay_ms': max_delay * 1000,
         }
 
         return stats
 
     def export_to_csv(self, filename: str):
         """Export per-message metrics to CSV."""
-        with open(filename, 'w', newline='') as csvfile:
+        # 1 MiB buffer: rows are streamed straight from the message lists, so
+        # a large buffer turns many small writes into a few large ones
+        with open(filename, 'w', buffering=1 << 20, newline='') as csvfile:
             fieldnames = [
                 'msg_id', 'stream_id', 'seq_num', 'priority',
                 'src_node', 'dst_node', 'size_bytes',
                 'creation_time', 'arrival_time', 'end_to_end_delay_ms',
                 'dropped', 'drop_reason'
             ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            writer.writeheader()
-
-            # Write completed messages
-            for msg in self.completed_messages:
-                delay = msg.get_end_to_end_delay()
-                writer.writerow({
-                    'msg_id': msg.msg_id,
-                    'stream_id': msg.stream_id,
-                    'seq_num': msg.seq_num,
-                    'priority': msg.priority,
-                    'src_node': msg.src_node,
-                    'dst_node': msg.dst_node,
-                    'size_bytes': msg.size_bytes,
-                    'creation_time': msg.creation_time,
-                    'arrival_time': msg.arrival_time,
-                    'end_to_end_delay_ms': delay * 1000 if delay else None,
-                    'dropped': msg.dropped,
-                    'drop_reason': msg.drop_reason
-                })
+            writer = csv.writer(csvfile)
+
+            writer.writerow(fieldnames)
+
+            # Write completed messages (rows are tuples in fieldnames order;
+            # a zero or undefined delay is written empty, as before)
+            writer.writerows(
+                (msg.msg_id, msg.stream_id, msg.seq_num, msg.priority,
+                 msg.src_node, msg.dst_node, msg.size_bytes,
+                 msg.creation_time, msg.arrival_time,
+                 (msg.arrival_time - msg.creation_time) * 1000
+                 if not msg.dropped and msg.arrival_time is not None
+                 and msg.arrival_time != msg.creation_time else None,
+                 msg.dropped, msg.drop_reason)
+                for msg in self.completed_messages
+            )
 
             # Write dropped messages
-            for msg in self.dropped_messages:
-                writer.writerow({
-                    'msg_id': msg.msg_id,
-                    'stream_id': msg.stream_id,
-                    'seq_num': msg.seq_num,
-                    'priority': msg.priority,
-                    'src_node': msg.src_node,
-                    'dst_node': msg.dst_node,
-                    'size_bytes': msg.size_bytes,
-                    'creation_time': msg.creation_time,
-                    'arrival_time': None,
-                    'end_to_end_delay_ms': None,
-                    'dropped': True,
-                    'drop_reason': msg.drop_reason
-                })
+            writer.writerows(
+                (msg.msg_id, msg.stream_id, msg.seq_num, msg.priority,
+                 msg.src_node, msg.dst_node, msg.size_bytes,
+                 msg.creation_time, None, None,
+                 True, msg.drop_reason)
+                for msg in self.dropped_messages
+            )
 
         print(f"Exported {len(self.completed_messages) + len(self.dropped_messages)} messages to {filename}")
 
-    def visualize_per_stream(self, output_file: str = 'stream_metrics.png'):
-        """Generate per-stream visualization of delay, throughput, jitter, and drops."""
+    def visualize_per_stream(self, output_file: str = 'stream_metrics.png',
+                             dpi: int = 100, compress_level: int = 3,
+                             keep_figure: bool = False):
+        """
+        Generate per-stream visualization of delay, throughput, jitter, and drops.
+
+        Args:
+            output_file: PNG file to write
+            dpi: Output resolution
+            compress_level: PNG zlib compression level (0-9, lower is faster)
+            keep_figure: Keep the figure open so repeated calls reuse it; the
+                caller must then release it with close()
+        """
         try:
-            import matplotlib.pyplot as plt
+            plt = _pyplot()
         except ImportError:
             print("Warning: matplotlib not available, skipping visualization")
             return
@@ -739,114 +1020,106 @@ class Network:
             print("No messages to visualize")
             return
 
-        # Sort streams by priority (highest first)
-        sorted_streams = sorted(
-            self.streams.items(),
-            key=lambda x: x[1].priority,
-            reverse=True
-        )
-
-        num_streams = len(sorted_streams)
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-
-        # Prepare data for each stream
-        stream_ids = []
-        stream_labels = []
-        delays = []
-        jitters = []
-        throughputs = []
-        drops = []
-
-        for stream_id, stream in sorted_streams:
-            stats = self.get_stream_statistics(stream_id)
-            if stats['total_messages'] == 0:
-                continue
-
-            stream_ids.append(stream_id)
-            stream_labels.append(f"S{stream_id}\nP{stream.priority}")
-            delays.append(stats['mean_delay_ms'])
-            jitters.append(stats['mean_jitter_ms'])
-            throughputs.append(stats['throughput_mbps'])
-            drops.append(stats['dropped_messages'])
+        num_streams = len(self.streams)
+        if self._fig_stream is None:
+            self._fig_stream, self._axes_stream = plt.subplots(2, 2, figsize=(14, 10))
+        else:
+            for ax in self._axes_stream.flat:
+                ax.clear()
+        fig, axes = self._fig_stream, self._axes_stream
 
-        if not stream_ids:
+        # One column per metric, streams sorted by priority (highest first)
+        columns = self.get_all_stream_statistics()
+        if not len(columns['stream_ids']):
             print("No stream data to visualize")
             return
 
-        # Color map by priority
-        colors = []
-        for stream_id, _ in sorted_streams:
-            if stream_id in stream_ids:
-                priority = self.streams[stream_id].priority
-                colors.append(plt.cm.RdYlGn(priority / 7.0))
+        stream_ids = columns['stream_ids']
+        priorities = columns['priorities']
+        delays = columns['mean_delay_ms']
+        jitters = columns['mean_jitter_ms']
+        throughputs = columns['throughput_mbps']
+        drops = columns['drops']
+        stream_labels = [f"S{stream_id}\nP{priority}" for stream_id, priority in zip(stream_ids, priorities)]
+        colors = _priority_colors()[priorities]  # Color map by priority
+        xs = np.arange(len(stream_ids))  # Shared bar positions for all four panels
 
         # Plot 1: Mean Delay
         ax1 = axes[0, 0]
-        bars1 = ax1.bar(range(len(stream_ids)), delays, color=colors, edgecolor='black', linewidth=1.5)
+        bars1 = ax1.bar(xs, delays, color=colors, edgecolor='black', linewidth=1.5)
         ax1.set_xlabel('Stream (Priority)', fontweight='bold')
         ax1.set_ylabel('Mean Delay (ms)', fontweight='bold')
         ax1.set_title('Mean End-to-End Delay per Stream', fontweight='bold')
-        ax1.set_xticks(range(len(stream_ids)))
+        ax1.set_xticks(xs)
         ax1.set_xticklabels(stream_labels)
         ax1.grid(axis='y', alpha=0.3)
 
         # Add value labels on bars
-        for i, (bar, val) in enumerate(zip(bars1, delays)):
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height(),
-                    f'{val:.2f}', ha='center', va='bottom', fontsize=9)
+        ax1.bar_label(bars1, fmt='%.2f', fontsize=9)
 
         # Plot 2: Mean Jitter
         ax2 = axes[0, 1]
-        bars2 = ax2.bar(range(len(stream_ids)), jitters, color=colors, edgecolor='black', linewidth=1.5)
+        bars2 = ax2.bar(xs, jitters, color=colors, edgecolor='black', linewidth=1.5)
         ax2.set_xlabel('Stream (Priority)', fontweight='bold')
         ax2.set_ylabel('Mean Jitter (ms)', fontweight='bold')
         ax2.set_title('Mean Jitter per Stream', fontweight='bold')
-        ax2.set_xticks(range(len(stream_ids)))
+        ax2.set_xticks(xs)
         ax2.set_xticklabels(stream_labels)
         ax2.grid(axis='y', alpha=0.3)
 
-        for i, (bar, val) in enumerate(zip(bars2, jitters)):
-            ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height(),
-                    f'{val:.2f}', ha='center', va='bottom', fontsize=9)
+        ax2.bar_label(bars2, fmt='%.2f', fontsize=9)
 
         # Plot 3: Throughput
         ax3 = axes[1, 0]
-        bars3 = ax3.bar(range(len(stream_ids)), throughputs, color=colors, edgecolor='black', linewidth=1.5)
+        bars3 = ax3.bar(xs, throughputs, color=colors, edgecolor='black', linewidth=1.5)
         ax3.set_xlabel('Stream (Priority)', fontweight='bold')
         ax3.set_ylabel('Throughput (Mbps)', fontweight='bold')
         ax3.set_title('Throughput per Stream', fontweight='bold')
-        ax3.set_xticks(range(len(stream_ids)))
+        ax3.set_xticks(xs)
         ax3.set_xticklabels(stream_labels)
         ax3.grid(axis='y', alpha=0.3)
 
-        for i, (bar, val) in enumerate(zip(bars3, throughputs)):
-            ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height(),
-                    f'{val:.2f}', ha='center', va='bottom', fontsize=9)
+        ax3.bar_label(bars3, fmt='%.2f', fontsize=9)
 
         # Plot 4: Packet Drops
         ax4 = axes[1, 1]
-        bars4 = ax4.bar(range(len(stream_ids)), drops, color=colors, edgecolor='black', linewidth=1.5)
+        bars4 = ax4.bar(xs, drops, color=colors, edgecolor='black', linewidth=1.5)
         ax4.set_xlabel('Stream (Priority)', fontweight='bold')
         ax4.set_ylabel('Dropped Messages', fontweight='bold')
         ax4.set_title('Message Drops per Stream', fontweight='bold')
-        ax4.set_xticks(range(len(stream_ids)))
+        ax4.set_xticks(xs)
         ax4.set_xticklabels(stream_labels)
         ax4.grid(axis='y', alpha=0.3)
 
-        for i, (bar, val) in enumerate(zip(bars4, drops)):
-            if val > 0:
-                ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height(),
-                        f'{int(val)}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+        # Only label streams that actually dropped messages
+        ax4.bar_label(bars4, labels=[f'{int(val)}' if val > 0 else '' for val in drops],
+                      fontsize=9, fontweight='bold')
 
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        self._tight_layout('stream', fig)
+        fig.savefig(output_file, dpi=dpi, pil_kwargs={'compress_level': compress_level})
         print(f"Per-stream visualization saved to {output_file}")
-        plt.close()
 
-    def visualize_delay_timeseries(self, output_file: str = 'delay_timeseries.png'):
-        """Generate time-series plot of delays for each stream."""
+        if not keep_figure:
+            plt.close(fig)
+            self._fig_stream = self._axes_stream = None
+
+    def visualize_delay_timeseries(self, output_file: str = 'delay_timeseries.png',
+                                   dpi: int = 100, compress_level: int = 3,
+                                   keep_figure: bool = False):
+        """
+        Generate time-series plot of delays for each stream.
+
+        Args:
+            output_file: PNG file to write
+            dpi: Output resolution
+            compress_level: PNG zlib compression level (0-9, lower is faster)
+            keep_figure: Keep the figure open so repeated calls reuse it; the
+                caller must then release it with close()
+        """
         try:
-            import matplotlib.pyplot as plt
+            plt = _pyplot()
+            from matplotlib.collections import LineCollection
+            from matplotlib.lines import Line2D
         except ImportError:
             print("Warning: matplotlib not available, skipping visualization")
             return
@@ -855,38 +1128,93 @@ class Network:
             print("No messages to visualize")
             return
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        if self._fig_timeseries is None:
+            self._fig_timeseries, self._ax_timeseries = plt.subplots(figsize=(12, 6))
+        else:
+            self._ax_timeseries.clear()
+        fig, ax = self._fig_timeseries, self._ax_timeseries
+
+        # Streams sorted by priority for legend ordering
+        sorted_streams = self._streams_by_priority
+        priority_colors = _priority_colors()
 
-        # Sort streams by priority for legend ordering
-        sorted_streams = sorted(
-            self.streams.items(),
-            key=lambda x: x[1].priority,
-            reverse=True
-        )
+        # Collect every stream first so all lines and markers render in one artist each
+        segments = []
+        line_colors = []
+        point_colors = []
+        handles = []
 
         for stream_id, stream in sorted_streams:
-            messages = self.completed_by_stream.get(stream_id, [])
-            if not messages:
+            arrivals = self.arrival_times_by_stream.get(stream_id)
+            if not arrivals:
                 continue
 
-            times = [msg.creation_time for msg in messages]
-            delays = [msg.get_end_to_end_delay() * 1000 for msg in messages]
+            # Read the per-stream columns directly (matplotlib implies NumPy)
+            times = np.frombuffer(self.creation_times_by_stream[stream_id], dtype=np.float64)
+            delays = _column_delays(arrivals, self.creation_times_by_stream[stream_id]) * 1000
 
             # Color based on priority
-            color = plt.cm.RdYlGn(stream.priority / 7.0)
-            ax.plot(times, delays, marker='o', markersize=3, linewidth=1.5,
-                   label=f"Stream {stream_id} (P{stream.priority})", color=color, alpha=0.7)
+            color = priority_colors[stream.priority]
+            segments.append(np.column_stack((times, delays)))
+            line_colors.append(color)
+            point_colors.append(np.broadcast_to(color, (len(times), 4)))
+            handles.append(Line2D([], [], marker='o', markersize=3, linewidth=1.5, color=color,
+                                  alpha=0.7, label=f"Stream {stream_id} (P{stream.priority})"))
+
+        if segments:
+            ax.add_collection(LineCollection(segments, colors=line_colors, linewidths=1.5, alpha=0.7))
+            points = np.concatenate(segments)
+            ax.scatter(points[:, 0], points[:, 1], s=9, c=np.concatenate(point_colors), alpha=0.7)
+            ax.autoscale_view()
 
         ax.set_xlabel('Simulation Time (s)', fontweight='bold')
         ax.set_ylabel('End-to-End Delay (ms)', fontweight='bold')
         ax.set_title('End-to-End Delay Over Time (Per Stream)', fontweight='bold')
-        ax.legend(loc='best', framealpha=0.9)
+        ax.legend(handles=handles, loc='best', framealpha=0.9)
         ax.grid(True, alpha=0.3)
 
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        self._tight_layout('timeseries', fig)
+        fig.savefig(output_file, dpi=dpi, pil_kwargs={'compress_level': compress_level})
         print(f"Delay time-series visualization saved to {output_file}")
-        plt.close()
+
+        if not keep_figure:
+            plt.close(fig)
+            self._fig_timeseries = self._ax_timeseries = None
+
+    def _tight_layout(self, role: str, fig):
+        """
+        Apply tight_layout, reusing the previous result when the ticks match.
+
+        The layout only depends on the (constant) titles and axis labels and on
+        the tick labels, so when every axis has the same ticks as last time the
+        cached subplot parameters are applied without re-solving the layout.
+        """
+        key = tuple(
+            (tuple(ax.get_xticks()), tuple(label.get_text() for label in ax.get_xticklabels()),
+             tuple(ax.get_yticks()))
+            for ax in fig.axes
+        )
+        cached = self._layouts.get(role)
+        if cached is not None and cached[0] == key:
+            fig.subplots_adjust(**cached[1])
+            return
+
+        fig.tight_layout()
+        params = fig.subplotpars
+        self._layouts[role] = (key, {'left': params.left, 'right': params.right,
+                                     'bottom': params.bottom, 'top': params.top,
+                                     'wspace': params.wspace, 'hspace': params.hspace})
+
+    def close(self):
+        """Release the figures kept by visualize calls with keep_figure=True."""
+        if self._fig_stream is None and self._fig_timeseries is None:
+            return
+        plt = _pyplot()
+        for fig in (self._fig_stream, self._fig_timeseries):
+            if fig is not None:
+                plt.close(fig)
+        self._fig_stream = self._axes_stream = None
+        self._fig_timeseries = self._ax_timeseries = None
 
 
 def main():
@@ -899,94 +1227,43 @@ def main():
 
     print("Building priority-based stream network...")
 
-    # Create topology: 3 nodes -> 1 switch (star topology)
-    node1 = network.add_node("Node1")
-    node2 = network.add_node("Node2")
-    node3 = network.add_node("Node3")
-
-    # Create switch with limited queue (to demonstrate drops)
-    switch = network.add_switch("Switch1", max_queue_size=50)
-
-    # Create links (100 Mbps, 1ms delay)
-    link_n1_sw = Link("Node1->Switch", bandwidth_mbps=100, delay_ms=1)
-    link_n2_sw = Link("Node2->Switch", bandwidth_mbps=100, delay_ms=1)
-    link_n3_sw = Link("Node3->Switch", bandwidth_mbps=100, delay_ms=1)
-    link_sw_n1 = Link("Switch->Node1", bandwidth_mbps=100, delay_ms=1)
-    link_sw_n2 = Link("Switch->Node2", bandwidth_mbps=100, delay_ms=1)
-    link_sw_n3 = Link("Switch->Node3", bandwidth_mbps=100, delay_ms=1)
-
-    # Configure nodes
-    node1.set_output_link(link_n1_sw)
-    node1.set_next_hop("Switch1")
-    node2.set_output_link(link_n2_sw)
-    node2.set_next_hop("Switch1")
-    node3.set_output_link(link_n3_sw)
-    node3.set_next_hop("Switch1")
-
-    # Configure switch
-    switch.add_link("Node1", link_sw_n1)
-    switch.add_link("Node2", link_sw_n2)
-    switch.add_link("Node3", link_sw_n3)
-    switch.set_forwarding_entry("Node1", "Node1")
-    switch.set_forwarding_entry("Node2", "Node2")
-    switch.set_forwarding_entry("Node3", "Node3")
-
-    # Create streams with different priorities
-    # High priority stream (Node1 -> Node2)
-    stream1 = Stream(
-        stream_id=1,
-        priority=7,  # Highest priority
-        src_node="Node1",
-        dst_node="Node2",
-        message_interval_sec=0.1,  # 100ms
-        message_size_bytes=1500,
-        description="High priority critical traffic"
-    )
-
-    # Medium priority stream (Node2 -> Node3)
-    stream2 = Stream(
-        stream_id=2,
-        priority=4,  # Medium priority
-        src_node="Node2",
-        dst_node="Node3",
-        message_interval_sec=0.08,  # 80ms
-        message_size_bytes=1200,
-        description="Medium priority business traffic"
+    # Scenario description: 3 nodes -> 1 switch (star topology), 100 Mbps / 1 ms links
+    NODE_NAMES = ("Node1", "Node2", "Node3")
+    LINK_BANDWIDTH_MBPS = 100
+    LINK_DELAY_MS = 1
+
+    # (stream_id, priority, src, dst, interval_sec, size_bytes, description, start_time)
+    STREAM_SPECS = (
+        # High priority stream, 100ms interval
+        (1, 7, "Node1", "Node2", 0.1, 1500, "High priority critical traffic", 0.0),
+        # Medium priority stream, 80ms interval
+        (2, 4, "Node2", "Node3", 0.08, 1200, "Medium priority business traffic", 0.02),
+        # Low priority stream, 50ms interval (more frequent, larger messages)
+        (3, 1, "Node3", "Node1", 0.05, 2000, "Low priority bulk transfer", 0.04),
+        # Lowest priority background stream for congestion, 30ms interval
+        (4, 0, "Node1", "Node3", 0.03, 1800, "Background traffic", 0.06),
     )
 
-    # Low priority stream (Node3 -> Node1)
-    stream3 = Stream(
-        stream_id=3,
-        priority=1,  # Low priority
-        src_node="Node3",
-        dst_node="Node1",
-        message_interval_sec=0.05,  # 50ms (more frequent)
-        message_size_bytes=2000,  # Larger messages
-        description="Low priority bulk transfer"
-    )
+    nodes = [network.add_node(name) for name in NODE_NAMES]
 
-    # Additional low priority stream for congestion
-    stream4 = Stream(
-        stream_id=4,
-        priority=0,  # Lowest priority
-        src_node="Node1",
-        dst_node="Node3",
-        message_interval_sec=0.03,  # 30ms (very frequent)
-        message_size_bytes=1800,
-        description="Background traffic"
-    )
+    # Create switch with limited queue (to demonstrate drops)
+    switch = network.add_switch("Switch1", max_queue_size=50)
 
-    # Add streams to network
-    network.add_stream(stream1)
-    network.add_stream(stream2)
-    network.add_stream(stream3)
-    network.add_stream(stream4)
-
-    # Start streams on nodes
-    node1.add_stream(stream1, start_time=0.0)
-    node2.add_stream(stream2, start_time=0.02)
-    node3.add_stream(stream3, start_time=0.04)
-    node1.add_stream(stream4, start_time=0.06)
+    # Connect each node to the switch in both directions
+    for node in nodes:
+        node.set_output_link(Link(f"{node.name}->Switch", LINK_BANDWIDTH_MBPS, LINK_DELAY_MS))
+        node.set_next_hop(switch.name)
+        switch.add_link(node.name, Link(f"Switch->{node.name}", LINK_BANDWIDTH_MBPS, LINK_DELAY_MS))
+        switch.set_forwarding_entry(node.name, node.name)
+
+    # Create streams with different priorities and register them
+    streams = [(Stream(*spec), start_time) for *spec, start_time in STREAM_SPECS]
+    for stream, _ in streams:
+        network.add_stream(stream)
+
+    # Start streams on their source nodes
+    for stream, start_time in streams:
+        network.nodes[stream.src_node].add_stream(stream, start_time=start_time)
 
     print(f"\nConfiguration:")
     print(f"  - 3 nodes connected to 1 switch (star topology)")
@@ -19,9 +19,14 @@ Examples:
 """
 
 import argparse
+import contextlib
+import importlib.util
+import io
+import multiprocessing
 import os
 import sys
-import subprocess
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 
 # Add project root to Python path
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -37,18 +42,61 @@ if os.path.exists(os.path.join(SIMULATOR_PATH, 'priority_stream_simulator')):
 TOPOLOGIES = ['tree', 'ring', 'rail_optimized']
 MODES = ['scenarios', 'preemptive', 'all']
 
+# Environment variable passing each experiment script its share of the
+# --jobs CPU budget; the scripts size their own worker pools from it
+JOBS_ENV = 'COLL_SIM_JOBS'
 
-def run_command(cmd, cwd):
-    """Run a command and return the result."""
+
+def run_python_module(script, cwd):
+    """
+    Load a script from cwd and call its main() in this interpreter.
+
+    Running in-process avoids a fresh interpreter per experiment and keeps
+    NumPy, matplotlib and the simulator modules loaded across runs. The
+    working directory is switched for the call since the scripts use
+    relative result/plot paths; it is restored afterwards, together with
+    sys.path (which the scripts extend) and sys.modules.
+    """
     print(f"\n{'='*70}")
-    print(f"Running: {' '.join(cmd)}")
+    print(f"Running: {script}")
     print(f"Working directory: {cwd}")
     print(f"{'='*70}\n")
 
-    result = subprocess.run(cmd, cwd=cwd, capture_output=False, text=True)
-
-    if result.returncode != 0:
-        print(f"\n[ERROR] Command failed with exit code {result.returncode}")
+    path = os.path.join(cwd, script)
+    # Unique module name per script path so topologies do not share a module
+    name = os.path.relpath(path, PROJECT_ROOT).replace(os.sep, '_').replace('.', '_')
+    old_cwd = os.getcwd()
+    old_path = sys.path[:]
+    returncode = 0
+    try:
+        sys.path.insert(0, cwd)
+        os.chdir(cwd)
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        # Registered like a regular import while main() runs, so functions
+        # and classes defined by the script can be pickled to *forked*
+        # worker processes (which inherit sys.modules). Spawned workers
+        # cannot import this synthetic name.
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        module.main()
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            returncode = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except Exception:
+        traceback.print_exc()
+        returncode = 1
+    finally:
+        os.chdir(old_cwd)
+        sys.path[:] = old_path
+        sys.modules.pop(name, None)
+        sys.stdout.flush()
+
+    if returncode != 0:
+        print(f"\n[ERROR] Command failed with exit code {returncode}")
         return False
     return True
 
@@ -62,12 +110,12 @@ def run_scenarios(topology_dir, analyze=False):
         return False
 
     # Run experiments
-    success = run_command(['python3', 'run_experiment.py'], scenarios_dir)
+    success = run_python_module('run_experiment.py', scenarios_dir)
 
     # Run analysis if requested
     if analyze and success:
         print("\nRunning analysis...")
-        run_command(['python3', 'analyze_results.py'], scenarios_dir)
+        run_python_module('analyze_results.py', scenarios_dir)
 
     return success
 
@@ -81,16 +129,65 @@ def run_preemptive(topology_dir, analyze=False):
         return False
 
     # Run experiments
-    success = run_command(['python3', 'run_preemptive_experiments.py'], preemptive_dir)
+    success = run_python_module('run_preemptive_experiments.py', preemptive_dir)
 
     # Run analysis if requested
     if analyze and success:
         print("\nRunning analysis...")
-        run_command(['python3', 'analyze_preemption.py'], preemptive_dir)
+        run_python_module('analyze_preemption.py', preemptive_dir)
 
     return success
 
 
+def set_jobs_budget(jobs):
+    """Give experiment scripts started by this process a budget of jobs CPUs."""
+    os.environ[JOBS_ENV] = str(max(1, jobs))
+
+
+def run_task_captured(func, args):
+    """Run an experiment task and return (success, printed output)."""
+    output = io.StringIO()
+    # stderr is captured too so tracebacks stay next to the task's own log
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        ok = func(*args)
+    return ok, output.getvalue()
+
+
+def run_tasks(tasks, jobs):
+    """
+    Run (function, args) experiment tasks, in parallel when jobs > 1.
+
+    Scenario and preemptive experiments write to separate result
+    directories, so they can run in separate processes. Workers use the
+    'spawn' start method so each starts from a fresh interpreter rather
+    than a copy of this one. Each worker's output is captured and printed
+    in task order, so the log reads the same as a serial run.
+
+    jobs is a total CPU budget shared with the scripts' own worker pools:
+    each task process gets jobs // workers of it (via JOBS_ENV), so nested
+    pools never oversubscribe the machine.
+
+    Returns:
+        True if every task succeeded
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        set_jobs_budget(jobs)
+        return all([func(*args) for func, args in tasks])
+
+    workers = min(jobs, len(tasks))
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=set_jobs_budget,
+                             initargs=(jobs // workers,)) as executor:
+        futures = [executor.submit(run_task_captured, func, args) for func, args in tasks]
+        success = True
+        for future in futures:
+            ok, output = future.result()
+            print(output, end="")
+            success = success and ok
+        return success
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Run collective communication simulation experiments',
@@ -133,6 +230,14 @@ Examples:
         help='Run analysis and generate plots after experiments'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='CPU budget shared by parallel experiments and their worker '
+             'processes (default: CPU count)'
+    )
+
     args = parser.parse_args()
 
     # Construct topology directory path
@@ -151,13 +256,15 @@ Examples:
     print(f"{'#'*70}\n")
 
     # Run requested experiments
-    success = True
+    tasks = []
 
     if args.mode == 'scenarios' or args.mode == 'all':
-        success = run_scenarios(topology_dir, args.analyze) and success
+        tasks.append((run_scenarios, (topology_dir, args.analyze)))
 
     if args.mode == 'preemptive' or args.mode == 'all':
-        success = run_preemptive(topology_dir, args.analyze) and success
+        tasks.append((run_preemptive, (topology_dir, args.analyze)))
+
+    success = run_tasks(tasks, args.jobs)
 
     if success:
         print(f"\n{'='*70}")
@@ -10,20 +10,73 @@ Compares frame preemption vs strict priority scheduling.
 
 import sys
 import os
+import pathlib
 
-# Add project paths
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
-sys.path.insert(0, PROJECT_ROOT)
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
-# Add priority stream simulator (in parent directory)
+# Add project paths (this file is three levels below the project root), plus
+# the priority stream simulator's parent directory. Already-present entries
+# are skipped so re-imports (e.g. in worker processes) don't grow sys.path.
+PROJECT_ROOT = str(pathlib.Path(__file__).resolve().parents[3])
 SIMULATOR_PATH = os.path.dirname(PROJECT_ROOT)
-sys.path.insert(0, SIMULATOR_PATH)
+for _path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src'), SIMULATOR_PATH):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
+import contextlib
+import io
+import multiprocessing
+
+# The simulator modules (and numpy behind them) are imported where they are
+# first used, so importing this module (e.g. for --help) stays cheap.
+if TYPE_CHECKING:
+    from priority_stream_simulator import Network
+
+
+@lru_cache(maxsize=None)
+def _build_pattern_specs(collective_type: str, node_names: tuple,
+                         msg_size: int, interval: float, allreduce_algorithm: str = "tree"):
+    """
+    Expand a collective pattern once and cache it.
 
-from priority_stream_simulator import Network, Link, Stream
-from collectives.patterns import CollectivePatterns
-from switch.preemptive_switch import PreemptiveSwitch
-import os
+    The pattern only depends on the node set, so protected and unprotected
+    runs share the expansion.
+
+    Returns:
+        Tuple of (specs, summary): specs holds (stream_id, src, dst,
+        size_bytes, description_suffix) tuples, the run's description prefix
+        being prepended to the suffix; summary is the generator's output
+    """
+    from collectives.patterns import CollectivePatterns
+
+    patterns = CollectivePatterns(list(node_names), base_stream_id=1000)
+
+    # Captured so each run can print the summary, even from the cache
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        if collective_type == "all-to-all":
+            streams = patterns.all_to_all(priority=7, message_size_bytes=msg_size,
+                                          interval_sec=interval, description="")
+        elif collective_type == "all-reduce":
+            streams = patterns.all_reduce(priority=7, message_size_bytes=msg_size,
+                                          interval_sec=interval, description="",
+                                          algorithm=allreduce_algorithm)
+        elif collective_type == "hierarchical-all-to-all":
+            # Rack-aware: aggregate at each rack's leader before crossing racks
+            streams = patterns.hierarchical_all_to_all(priority=7, message_size_bytes=msg_size,
+                                                       interval_sec=interval, description="",
+                                                       nodes_per_rack=4)
+        elif collective_type == "hierarchical-all-reduce":
+            streams = patterns.hierarchical_all_reduce(priority=7, message_size_bytes=msg_size,
+                                                       interval_sec=interval, description="",
+                                                       nodes_per_rack=4)
+        else:
+            raise ValueError(f"Unknown collective type: {collective_type}")
+
+    specs = tuple((s.stream_id, s.src_node, s.dst_node, s.message_size_bytes, s.description)
+                  for s in streams)
+    return specs, output.getvalue()
 
 
 class PreemptiveRailOptimizedTopology:
@@ -33,8 +86,12 @@ class PreemptiveRailOptimizedTopology:
     2 ToR switches with preemption capability, connected directly.
     """
 
+    # (node, its ToR, the other ToR): N0-N3 in Rack 0, N4-N7 in Rack 1
+    ACCESS_TABLE = tuple((f"N{i}", 'ToR0', 'ToR1') if i < 4 else (f"N{i}", 'ToR1', 'ToR0')
+                         for i in range(8))
+
     def __init__(self,
-                 network: Network,
+                 network: "Network",
                  preemption_enabled: bool = True,
                  access_bw_mbps: float = 1000,
                  inter_rack_bw_mbps: float = 2000,
@@ -68,10 +125,12 @@ class PreemptiveRailOptimizedTopology:
     def build(self):
         """Build the rail-optimized topology with preemptive switches."""
         mode_str = "WITH PREEMPTION" if self.preemption_enabled else "WITHOUT PREEMPTION"
-        print(f"Building rail-optimized topology {mode_str}...")
-        print(f"  - 8 compute nodes (2 racks)")
-        print(f"  - 2 preemptive ToR switches")
-        print(f"  - Preemption: {'ENABLED' if self.preemption_enabled else 'DISABLED'}")
+        print(f"Building rail-optimized topology {mode_str}...\n"
+              f"  - 8 compute nodes (2 racks)\n"
+              f"  - 2 preemptive ToR switches\n"
+              f"  - Preemption: {'ENABLED' if self.preemption_enabled else 'DISABLED'}")
+
+        from switch.preemptive_switch import PreemptiveSwitch
 
         # Create preemptive switches and register with network
         self.switches['ToR0'] = PreemptiveSwitch('ToR0', self.network, self.queue_size, self.preemption_enabled)
@@ -89,13 +148,14 @@ class PreemptiveRailOptimizedTopology:
         # Create links
         self._create_inter_rack_links()
         self._create_access_links()
-        self._configure_forwarding()
 
         print("Topology built successfully!")
         return self
 
     def _create_inter_rack_links(self):
         """Create bidirectional link between ToR switches."""
+        from priority_stream_simulator import Link
+
         # ToR0 <-> ToR1
         self.links['ToR0->ToR1'] = Link('ToR0->ToR1',
                                         bandwidth_mbps=self.inter_rack_bw,
@@ -109,62 +169,33 @@ class PreemptiveRailOptimizedTopology:
         self.switches['ToR1'].add_link('ToR0', self.links['ToR1->ToR0'])
 
     def _create_access_links(self):
-        """Create links between nodes and ToR switches."""
-        # N0-N3 connect to ToR0 (Rack 0)
-        for i in range(4):
-            node_name = f"N{i}"
-
-            # Node -> ToR0
-            link_up = Link(f'{node_name}->ToR0',
-                          bandwidth_mbps=self.access_bw,
-                          delay_ms=self.access_delay)
-            self.links[f'{node_name}->ToR0'] = link_up
-            self.nodes[node_name].set_output_link(link_up)
-            self.nodes[node_name].set_next_hop('ToR0')
-
-            # ToR0 -> Node
-            link_down = Link(f'ToR0->{node_name}',
-                            bandwidth_mbps=self.access_bw,
-                            delay_ms=self.access_delay)
-            self.links[f'ToR0->{node_name}'] = link_down
-            self.switches['ToR0'].add_link(node_name, link_down)
+        """
+        Create links between nodes and ToR switches and configure forwarding.
 
-        # N4-N7 connect to ToR1 (Rack 1)
-        for i in range(4, 8):
-            node_name = f"N{i}"
+        Each node's ToR forwards to it directly; the other ToR forwards
+        through the inter-rack link.
+        """
+        from priority_stream_simulator import Link
 
-            # Node -> ToR1
-            link_up = Link(f'{node_name}->ToR1',
+        for node_name, tor, other_tor in self.ACCESS_TABLE:
+            # Node -> ToR
+            link_up = Link(f'{node_name}->{tor}',
                           bandwidth_mbps=self.access_bw,
                           delay_ms=self.access_delay)
-            self.links[f'{node_name}->ToR1'] = link_up
+            self.links[f'{node_name}->{tor}'] = link_up
             self.nodes[node_name].set_output_link(link_up)
-            self.nodes[node_name].set_next_hop('ToR1')
+            self.nodes[node_name].set_next_hop(tor)
 
-            # ToR1 -> Node
-            link_down = Link(f'ToR1->{node_name}',
+            # ToR -> Node
+            link_down = Link(f'{tor}->{node_name}',
                             bandwidth_mbps=self.access_bw,
                             delay_ms=self.access_delay)
-            self.links[f'ToR1->{node_name}'] = link_down
-            self.switches['ToR1'].add_link(node_name, link_down)
-
-    def _configure_forwarding(self):
-        """Configure forwarding tables for all switches."""
-        # ToR0 forwarding
-        # N0-N3 are directly connected
-        for i in range(4):
-            self.switches['ToR0'].set_forwarding_entry(f"N{i}", f"N{i}")
-        # N4-N7 go through ToR1
-        for i in range(4, 8):
-            self.switches['ToR0'].set_forwarding_entry(f"N{i}", 'ToR1')
-
-        # ToR1 forwarding
-        # N4-N7 are directly connected
-        for i in range(4, 8):
-            self.switches['ToR1'].set_forwarding_entry(f"N{i}", f"N{i}")
-        # N0-N3 go through ToR0
-        for i in range(4):
-            self.switches['ToR1'].set_forwarding_entry(f"N{i}", 'ToR0')
+            self.links[f'{tor}->{node_name}'] = link_down
+            self.switches[tor].add_link(node_name, link_down)
+
+            # Forwarding: local delivery, remote rack via the local ToR
+            self.switches[tor].set_forwarding_entry(node_name, node_name)
+            self.switches[other_tor].set_forwarding_entry(node_name, tor)
 
     def get_node_names(self):
         """Get list of compute node names."""
@@ -176,28 +207,37 @@ class PreemptiveExperiment:
     Runs preemptive collective communication experiments.
     """
 
+    # Cross-subtree background traffic (src, dst) node indices
+    BACKGROUND_PAIRS = ((0, 4), (1, 5), (2, 6), (3, 7))
+
     def __init__(self,
                  sim_duration: float = 5.0,
                  collective_msg_size: int = 1000,
                  collective_interval: float = 0.05,
                  background_msg_size: int = 1500,
-                 background_interval: float = 0.03):
-        """Initialize experiment parameters."""
+                 background_interval: float = 0.03,
+                 allreduce_algorithm: str = "tree"):
+        """
+        Initialize experiment parameters.
+
+        allreduce_algorithm selects the all-reduce pattern: "tree" (reduce to
+        root + broadcast) or "rabenseifner" (reduce-scatter + all-gather).
+        """
         self.sim_duration = sim_duration
         self.collective_msg_size = collective_msg_size
         self.collective_interval = collective_interval
         self.background_msg_size = background_msg_size
         self.background_interval = background_interval
+        self.allreduce_algorithm = allreduce_algorithm
 
     def _add_background_traffic(self, network, topology, priority, base_stream_id):
         """Add background traffic streams."""
+        from priority_stream_simulator import Stream
+
         streams = []
         stream_id = base_stream_id
 
-        # Cross-subtree traffic
-        pairs = [(0, 4), (1, 5), (2, 6), (3, 7)]
-
-        for src_id, dst_id in pairs:
+        for src_id, dst_id in self.BACKGROUND_PAIRS:
             src = f"N{src_id}"
             dst = f"N{dst_id}"
 
@@ -213,58 +253,78 @@ class PreemptiveExperiment:
             streams.append(stream)
             stream_id += 1
 
-            network.add_stream(stream)
-            topology.nodes[src].add_stream(stream, start_time=0.01)
+        network.add_streams(streams)
+        network.start_streams(streams, start_time=0.01)
 
         print(f"  Added {len(streams)} background traffic streams (priority {priority})")
         return streams
 
-    def run_protected(self, collective_type: str, output_dir: str):
+    # Per-mode banner text, CSV prefix and collective description prefixes,
+    # keyed by preemption_enabled
+    MODES = {
+        True: {
+            'name': "protected",
+            'banner': ["PROTECTED MODE: {} WITH PREEMPTION",
+                       "Collective priority: 7 (CAN PREEMPT)",
+                       "Background priority: 1 (CAN BE PREEMPTED)",
+                       "Preemption: ENABLED"],
+            'all-to-all': "All-to-All-Preemptive",
+            'all-reduce': "All-Reduce-Preemptive",
+            'hierarchical-all-to-all': "Hierarchical-All-to-All-Preemptive",
+            'hierarchical-all-reduce': "Hierarchical-All-Reduce-Preemptive",
+        },
+        False: {
+            'name': "unprotected",
+            'banner': ["UNPROTECTED MODE: {} WITHOUT PREEMPTION",
+                       "Collective priority: 7 (CANNOT PREEMPT)",
+                       "Background priority: 1 (CANNOT BE PREEMPTED)",
+                       "Preemption: DISABLED (standard priority scheduling)"],
+            'all-to-all': "All-to-All-NonPreemptive",
+            'all-reduce': "All-Reduce-NonPreemptive",
+            'hierarchical-all-to-all': "Hierarchical-All-to-All-NonPreemptive",
+            'hierarchical-all-reduce': "Hierarchical-All-Reduce-NonPreemptive",
+        },
+    }
+
+    def _run(self, preemption_enabled: bool, collective_type: str, output_dir: str):
         """
-        Run Protected Mode: Preemption ENABLED.
+        Run one mode; the modes differ only in the switches' preemption flag.
 
-        High-priority collectives can preempt low-priority background.
+        Args:
+            preemption_enabled: True for Protected mode, False for Unprotected
+            collective_type: "all-to-all", "all-reduce", or their rack-aware
+                "hierarchical-" variants (one leader per 4-node rack)
+            output_dir: Directory for the mode's CSV file
         """
-        print("\n" + "="*70)
-        print(f"PROTECTED MODE: {collective_type.upper()} WITH PREEMPTION")
-        print("="*70)
-        print("Collective priority: 7 (CAN PREEMPT)")
-        print("Background priority: 1 (CAN BE PREEMPTED)")
-        print("Preemption: ENABLED")
-        print()
+        from priority_stream_simulator import Network, Stream
 
-        # Create network with preemptive topology
+        mode = self.MODES[preemption_enabled]
+        title, *details = mode['banner']
+        print("\n".join(["\n" + "="*70, title.format(collective_type.upper()), "="*70, *details, ""]))
+
+        # Create network with (non-)preemptive topology
         network = Network(sim_duration=self.sim_duration)
         topology = PreemptiveRailOptimizedTopology(
             network,
-            preemption_enabled=True,  # PREEMPTION ON
+            preemption_enabled=preemption_enabled,
             switch_queue_size=50
         ).build()
 
-        # Generate collective pattern
-        patterns = CollectivePatterns(topology.get_node_names(), base_stream_id=1000)
-
-        if collective_type == "all-to-all":
-            coll_streams = patterns.all_to_all(
-                priority=7,  # HIGH - can preempt
-                message_size_bytes=self.collective_msg_size,
-                interval_sec=self.collective_interval,
-                description="All-to-All-Preemptive"
-            )
-        elif collective_type == "all-reduce":
-            coll_streams = patterns.all_reduce(
-                priority=7,  # HIGH - can preempt
-                message_size_bytes=self.collective_msg_size,
-                interval_sec=self.collective_interval,
-                description="All-Reduce-Preemptive"
-            )
-        else:
-            raise ValueError(f"Unknown collective type: {collective_type}")
+        # Generate collective pattern (expanded once, shared across modes)
+        specs, summary = _build_pattern_specs(collective_type, tuple(topology.get_node_names()),
+                                              self.collective_msg_size, self.collective_interval,
+                                              self.allreduce_algorithm)
+        print(summary, end="")
+        prefix = mode[collective_type]
+        coll_streams = [
+            Stream(stream_id, 7, src, dst,  # HIGH priority
+                   self.collective_interval, size, prefix + suffix)
+            for stream_id, src, dst, size, suffix in specs
+        ]
 
         # Add collective streams
-        for stream in coll_streams:
-            network.add_stream(stream)
-            topology.nodes[stream.src_node].add_stream(stream, start_time=0.0)
+        network.add_streams(coll_streams)
+        network.start_streams(coll_streams, start_time=0.0)
 
         # Add background traffic (low priority)
         bg_streams = self._add_background_traffic(network, topology,
@@ -276,7 +336,7 @@ class PreemptiveExperiment:
         network.run()
 
         # Save results
-        csv_file = os.path.join(output_dir, f"protected_{collective_type}.csv")
+        csv_file = os.path.join(output_dir, f"{mode['name']}_{collective_type}.csv")
         network.export_to_csv(csv_file)
 
         print()
@@ -284,140 +344,74 @@ class PreemptiveExperiment:
 
         return network, topology, coll_streams, bg_streams
 
+    def run_protected(self, collective_type: str, output_dir: str):
+        """
+        Run Protected Mode: Preemption ENABLED.
+
+        High-priority collectives can preempt low-priority background.
+        """
+        return self._run(True, collective_type, output_dir)
+
     def run_unprotected(self, collective_type: str, output_dir: str):
         """
         Run Unprotected Mode: Preemption DISABLED.
 
         Standard priority scheduling, no mid-transmission interruption.
         """
-        print("\n" + "="*70)
-        print(f"UNPROTECTED MODE: {collective_type.upper()} WITHOUT PREEMPTION")
-        print("="*70)
-        print("Collective priority: 7 (CANNOT PREEMPT)")
-        print("Background priority: 1 (CANNOT BE PREEMPTED)")
-        print("Preemption: DISABLED (standard priority scheduling)")
-        print()
+        return self._run(False, collective_type, output_dir)
 
-        # Create network with non-preemptive topology
-        network = Network(sim_duration=self.sim_duration)
-        topology = PreemptiveRailOptimizedTopology(
-            network,
-            preemption_enabled=False,  # PREEMPTION OFF
-            switch_queue_size=50
-        ).build()
-
-        # Generate collective pattern
-        patterns = CollectivePatterns(topology.get_node_names(), base_stream_id=1000)
-
-        if collective_type == "all-to-all":
-            coll_streams = patterns.all_to_all(
-                priority=7,  # HIGH but can't preempt
-                message_size_bytes=self.collective_msg_size,
-                interval_sec=self.collective_interval,
-                description="All-to-All-NonPreemptive"
-            )
-        elif collective_type == "all-reduce":
-            coll_streams = patterns.all_reduce(
-                priority=7,  # HIGH but can't preempt
-                message_size_bytes=self.collective_msg_size,
-                interval_sec=self.collective_interval,
-                description="All-Reduce-NonPreemptive"
-            )
-        else:
-            raise ValueError(f"Unknown collective type: {collective_type}")
-
-        # Add collective streams
-        for stream in coll_streams:
-            network.add_stream(stream)
-            topology.nodes[stream.src_node].add_stream(stream, start_time=0.0)
-
-        # Add background traffic (low priority)
-        bg_streams = self._add_background_traffic(network, topology,
-                                                  priority=1,  # LOW
-                                                  base_stream_id=5000)
-
-        # Run simulation
-        print()
-        network.run()
-
-        # Save results
-        csv_file = os.path.join(output_dir, f"unprotected_{collective_type}.csv")
-        network.export_to_csv(csv_file)
-
-        print()
-        self._print_results(network, topology, coll_streams, bg_streams)
-
-        return network, topology, coll_streams, bg_streams
+    def run_mode_captured(self, preemption_enabled: bool, collective_type: str, output_dir: str) -> str:
+        """Run one mode in a worker process and return its console output."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self._run(preemption_enabled, collective_type, output_dir)
+        return output.getvalue()
 
     def _print_results(self, network, topology, coll_streams, bg_streams):
-        """Print summary results."""
-        print("="*70)
-        print("RESULTS SUMMARY")
-        print("="*70)
+        """Print summary results (collected and written to stdout in one call)."""
+        lines = ["="*70, "RESULTS SUMMARY", "="*70]
 
         # Global stats
         global_stats = network.get_global_statistics()
-        print(f"\nGlobal Statistics:")
-        print(f"  Total delivered: {global_stats['total_messages_delivered']}")
-        print(f"  Total dropped: {global_stats['total_messages_dropped']}")
-
-        # Collective stats
-        coll_stream_ids = [s.stream_id for s in coll_streams]
-        coll_total = 0
-        coll_dropped = 0
-        coll_delays = []
-
-        for sid in coll_stream_ids:
-            stats = network.get_stream_statistics(sid)
-            coll_total += stats['total_messages']
-            coll_dropped += stats['dropped_messages']
-            if stats['total_messages'] > 0:
-                coll_delays.append(stats['mean_delay_ms'])
-
-        coll_drop_rate = (coll_dropped / (coll_total + coll_dropped) * 100) if (coll_total + coll_dropped) > 0 else 0
-        coll_mean_delay = sum(coll_delays) / len(coll_delays) if coll_delays else 0
-
-        print(f"\nCollective Traffic:")
-        print(f"  Streams: {len(coll_streams)}")
-        print(f"  Messages delivered: {coll_total}")
-        print(f"  Messages dropped: {coll_dropped}")
-        print(f"  Drop rate: {coll_drop_rate:.2f}%")
-        print(f"  Mean delay: {coll_mean_delay:.3f} ms")
-
-        # Background stats
-        bg_stream_ids = [s.stream_id for s in bg_streams]
-        bg_total = 0
-        bg_dropped = 0
-        bg_delays = []
-
-        for sid in bg_stream_ids:
-            stats = network.get_stream_statistics(sid)
-            bg_total += stats['total_messages']
-            bg_dropped += stats['dropped_messages']
-            if stats['total_messages'] > 0:
-                bg_delays.append(stats['mean_delay_ms'])
-
-        bg_drop_rate = (bg_dropped / (bg_total + bg_dropped) * 100) if (bg_total + bg_dropped) > 0 else 0
-        bg_mean_delay = sum(bg_delays) / len(bg_delays) if bg_delays else 0
-
-        print(f"\nBackground Traffic:")
-        print(f"  Streams: {len(bg_streams)}")
-        print(f"  Messages delivered: {bg_total}")
-        print(f"  Messages dropped: {bg_dropped}")
-        print(f"  Drop rate: {bg_drop_rate:.2f}%")
-        print(f"  Mean delay: {bg_mean_delay:.3f} ms")
+        lines += [
+            "\nGlobal Statistics:",
+            f"  Total delivered: {global_stats['total_messages_delivered']}",
+            f"  Total dropped: {global_stats['total_messages_dropped']}",
+        ]
+
+        # Collective and background stats
+        for title, streams in (("Collective Traffic", coll_streams), ("Background Traffic", bg_streams)):
+            stats = network.get_stream_statistics_bulk([s.stream_id for s in streams])
+            delivered = stats['total_messages'] > 0
+            total = int(stats['total_messages'].sum())
+            dropped = int(stats['dropped_messages'].sum())
+
+            drop_rate = (dropped / (total + dropped) * 100) if (total + dropped) > 0 else 0
+            mean_delay = float(stats['mean_delay_ms'][delivered].mean()) if delivered.any() else 0
+
+            lines += [
+                f"\n{title}:",
+                f"  Streams: {len(streams)}",
+                f"  Messages delivered: {total}",
+                f"  Messages dropped: {dropped}",
+                f"  Drop rate: {drop_rate:.2f}%",
+                f"  Mean delay: {mean_delay:.3f} ms",
+            ]
 
         # Preemption stats
-        print(f"\nPreemption Statistics:")
+        lines.append("\nPreemption Statistics:")
         for name, switch in topology.switches.items():
             pstats = switch.get_preemption_statistics()
-            print(f"  {name}:")
-            print(f"    Preemption enabled: {pstats['preemption_enabled']}")
-            print(f"    Total preemptions: {pstats['total_preemptions']}")
+            lines += [
+                f"  {name}:",
+                f"    Preemption enabled: {pstats['preemption_enabled']}",
+                f"    Total preemptions: {pstats['total_preemptions']}",
+            ]
             if pstats['total_preemptions'] > 0:
-                print(f"    Avg overhead per preemption: {pstats['avg_overhead_per_preemption_ms']:.3f} ms")
+                lines.append(f"    Avg overhead per preemption: {pstats['avg_overhead_per_preemption_ms']:.3f} ms")
 
-        print("="*70 + "\n")
+        lines.append("="*70 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -436,19 +430,42 @@ def main():
         background_interval=0.03
     )
 
-    # Run experiments
+    # Run experiments. The 2 collectives x 2 modes (Protected: preemption ON,
+    # Unprotected: preemption OFF) are independent simulations writing
+    # separate CSVs, so they all run side by side. Workers are forked so they
+    # share this already-loaded module; fork is only used on Linux (it is
+    # unsafe on macOS once numpy/matplotlib are loaded), so elsewhere (or with
+    # a single CPU) the runs are serial.
     collectives = ["all-to-all", "all-reduce"]
+    modes = [(True, f"{results_dir}/protected"), (False, f"{results_dir}/unprotected")]
+    jobs = [(collective_type, preemption_enabled, output_dir)
+            for collective_type in collectives
+            for preemption_enabled, output_dir in modes]
+
+    executor = None
+    # CPU budget from run_simulation.py --jobs (COLL_SIM_JOBS), else every CPU
+    workers = min(len(jobs), int(os.environ.get('COLL_SIM_JOBS') or os.cpu_count() or 1))
+    if workers > 1 and sys.platform == 'linux':
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+        futures = {
+            job: executor.submit(experiment.run_mode_captured, job[1], job[0], job[2])
+            for job in jobs
+        }
 
     for collective_type in collectives:
         print("\n" + "#"*70)
         print(f"# PREEMPTIVE EXPERIMENT: {collective_type.upper()}")
         print("#"*70)
 
-        # Protected mode (preemption ON)
-        experiment.run_protected(collective_type, f"{results_dir}/protected")
+        # Worker output is replayed in order so the report reads as if run serially
+        for preemption_enabled, output_dir in modes:
+            if executor is None:
+                experiment._run(preemption_enabled, collective_type, output_dir)
+            else:
+                print(futures[collective_type, preemption_enabled, output_dir].result(), end="")
 
-        # Unprotected mode (preemption OFF)
-        experiment.run_unprotected(collective_type, f"{results_dir}/unprotected")
+    if executor is not None:
+        executor.shutdown()
 
     print("\n" + "="*70)
     print("ALL PREEMPTIVE EXPERIMENTS COMPLETED")
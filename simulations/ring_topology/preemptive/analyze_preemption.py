@@ -13,17 +13,40 @@ Metrics analyzed:
 
 import sys
 import os
+import pathlib
 
-# Add project paths
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
-sys.path.insert(0, PROJECT_ROOT)
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
-# Add priority stream simulator (in parent directory)
+# Add project paths (this file is three levels below the project root), plus
+# the priority stream simulator's parent directory. Already-present entries
+# are skipped so re-imports (e.g. in worker processes) don't grow sys.path.
+PROJECT_ROOT = str(pathlib.Path(__file__).resolve().parents[3])
 SIMULATOR_PATH = os.path.dirname(PROJECT_ROOT)
-sys.path.insert(0, SIMULATOR_PATH)
-
-from collections import defaultdict
+for _path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src'), SIMULATOR_PATH):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import io
+import multiprocessing
+
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved; also safe in forked workers
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+# Parsed results are cached next to each CSV (see load_results): as Parquet
+# when pyarrow is installed, otherwise as a pandas pickle. The cache file name
+# carries RESULTS_CACHE_VERSION (bump it whenever the parsing or columns
+# change) and the library versions that wrote it, so caches from older code
+# or an upgraded pandas/pyarrow are never read.
+RESULTS_CACHE_VERSION = 1
+try:
+    import pyarrow
+    RESULTS_CACHE_SUFFIX = (f'.v{RESULTS_CACHE_VERSION}-pandas{pd.__version__}'
+                            f'-pyarrow{pyarrow.__version__}.parquet')
+except ImportError:
+    RESULTS_CACHE_SUFFIX = f'.v{RESULTS_CACHE_VERSION}-pandas{pd.__version__}.pkl'
 
 
 class PreemptionAnalyzer:
@@ -40,36 +63,75 @@ class PreemptionAnalyzer:
         """
         self.results_dir = results_dir
 
+        # Loaded results and mode comparisons, keyed by (mode, collective)
+        # and collective; each CSV is parsed and analyzed only once
+        self._results = {}
+        self._comparisons = {}
+
     def load_results(self, mode: str, collective: str):
         """
         Load results from CSV file.
 
+        The DataFrame is cached and shared between callers, so it must not be
+        modified in place. The parsed frame is also saved next to the CSV
+        (RESULTS_CACHE_SUFFIX, which includes RESULTS_CACHE_VERSION) and reused
+        while it is newer than the CSV.
+
         Args:
             mode: 'protected' or 'unprotected'
             collective: 'all-to-all' or 'all-reduce'
 
         Returns:
-            List of dictionaries with results
+            DataFrame with one row per message (empty if the file is missing);
+            empty arrival times and delays are NaN
         """
+        key = (mode, collective)
+        if key not in self._results:
+            self._results[key] = self._read_results(mode, collective)
+        return self._results[key]
+
+    def _read_results(self, mode: str, collective: str):
+        """Parse the CSV file for a mode and collective (see load_results)."""
         csv_file = os.path.join(self.results_dir, mode,
                                f"{mode}_{collective}.csv")
 
         if not os.path.exists(csv_file):
             print(f"Warning: File not found: {csv_file}")
-            return []
-
-        data = []
-        with open(csv_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Convert numeric fields
-                row['stream_id'] = int(row['stream_id'])
-                row['priority'] = int(row['priority'])
-                row['dropped'] = row['dropped'].lower() == 'true'
-                if row['end_to_end_delay_ms']:
-                    row['end_to_end_delay_ms'] = float(row['end_to_end_delay_ms'])
-                data.append(row)
-
+            return pd.DataFrame()
+
+        cache_file = csv_file + RESULTS_CACHE_SUFFIX
+        if (os.path.exists(cache_file)
+                and os.path.getmtime(cache_file) >= os.path.getmtime(csv_file)):
+            try:
+                if RESULTS_CACHE_SUFFIX.endswith('.parquet'):
+                    return pd.read_parquet(cache_file)
+                return pd.read_pickle(cache_file)
+            except Exception as e:
+                # Any failure (truncated file, incompatible pickle, ...) is a
+                # cache miss: parse the CSV and rewrite the cache
+                print(f"Warning: Ignoring unreadable cache {cache_file}: {e}")
+
+        data = pd.read_csv(csv_file,
+                           dtype={'stream_id': 'int32', 'priority': 'int8',
+                                  'arrival_time': 'float64',
+                                  'end_to_end_delay_ms': 'float64',
+                                  'drop_reason': 'str'},
+                           float_precision='round_trip')
+        data['dropped'] = data['dropped'].astype(str).str.lower().eq('true')
+
+        # Write to a temporary file first so concurrent workers never read a
+        # partial cache; a read-only results directory just skips caching
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            if RESULTS_CACHE_SUFFIX.endswith('.parquet'):
+                data.to_parquet(tmp_file, compression='zstd')
+            else:
+                data.to_pickle(tmp_file)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: Could not write cache {cache_file}: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
         return data
 
     def _compute_flow_metrics(self, flow_data):
@@ -77,7 +139,7 @@ class PreemptionAnalyzer:
         Compute metrics for a set of flows.
 
         Args:
-            flow_data: List of dictionaries with flow results
+            flow_data: DataFrame with flow results
 
         Returns:
             Dictionary with metrics including tail latencies
@@ -85,57 +147,34 @@ class PreemptionAnalyzer:
         if len(flow_data) == 0:
             return {}
 
-        # Calculate per-stream metrics
-        stream_metrics = defaultdict(lambda: {'delays': [], 'delivered': 0, 'dropped': 0})
-
-        for row in flow_data:
-            sid = row['stream_id']
-            if row['dropped']:
-                stream_metrics[sid]['dropped'] += 1
-            else:
-                stream_metrics[sid]['delivered'] += 1
-                if row['end_to_end_delay_ms']:
-                    stream_metrics[sid]['delays'].append(row['end_to_end_delay_ms'])
-
-        # Aggregate metrics
-        all_delays = []
-        all_jitters = []
-        total_delivered = 0
-        total_dropped = 0
-
-        for sid, metrics in stream_metrics.items():
-            total_delivered += metrics['delivered']
-            total_dropped += metrics['dropped']
-            all_delays.extend(metrics['delays'])
-
-            # Calculate jitter for this stream
-            if len(metrics['delays']) > 1:
-                jitters = [abs(metrics['delays'][i] - metrics['delays'][i-1])
-                          for i in range(1, len(metrics['delays']))]
-                all_jitters.extend(jitters)
-
-        # Sort delays for percentile calculations
-        all_delays.sort()
-
-        # Calculate statistics
-        mean_delay = sum(all_delays) / len(all_delays) if all_delays else 0
-        std_delay = (sum((x - mean_delay)**2 for x in all_delays) / len(all_delays))**0.5 if all_delays else 0
-        min_delay = min(all_delays) if all_delays else 0
-        max_delay = max(all_delays) if all_delays else 0
-        mean_jitter = sum(all_jitters) / len(all_jitters) if all_jitters else 0
-
-        # Tail latencies (percentiles)
-        def percentile(data, p):
-            if not data:
-                return 0
-            k = (len(data) - 1) * p / 100.0
-            f = int(k)
-            c = f + 1 if f + 1 < len(data) else f
-            return data[f] + (k - f) * (data[c] - data[f])
-
-        p50 = percentile(all_delays, 50)
-        p95 = percentile(all_delays, 95)
-        p99 = percentile(all_delays, 99)
+        stream_id = flow_data['stream_id'].to_numpy()
+        dropped = flow_data['dropped'].to_numpy()
+        delay = flow_data['end_to_end_delay_ms'].to_numpy(dtype=np.float64)
+
+        total_dropped = int(dropped.sum())
+        total_delivered = dropped.size - total_dropped
+
+        # Delays of delivered messages, skipping empty (NaN) and zero delays
+        timed = ~dropped & (delay > 0)
+        delays = delay[timed]
+
+        # Jitter: delay change between consecutive messages of each stream
+        # (a stable sort by stream keeps each stream's arrival order)
+        order = np.argsort(stream_id[timed], kind='stable')
+        timed_streams = stream_id[timed][order]
+        jitters = np.abs(np.diff(delays[order]))[timed_streams[1:] == timed_streams[:-1]]
+
+        # Calculate statistics and tail latencies (linearly interpolated
+        # percentiles) in NumPy
+        if delays.size:
+            mean_delay = float(delays.mean())
+            std_delay = float(delays.std())
+            min_delay = float(delays.min())
+            max_delay = float(delays.max())
+            p50, p95, p99 = np.percentile(delays, [50, 95, 99]).tolist()
+        else:
+            mean_delay = std_delay = min_delay = max_delay = p50 = p95 = p99 = 0
+        mean_jitter = float(jitters.mean()) if jitters.size else 0
 
         total = total_delivered + total_dropped
         drop_rate = (total_dropped / total * 100) if total > 0 else 0
@@ -152,15 +191,32 @@ class PreemptionAnalyzer:
             'p95_delay': p95,
             'p99_delay': p99,
             'mean_jitter': mean_jitter,
-            'num_streams': len(stream_metrics)
+            'num_streams': int(np.unique(stream_id).size)
         }
 
+    def _partition(self, data, collective_stream_base: int = 1000, low_priority_stream_min: int = 5000):
+        """
+        Split results into collective and low priority flows in one pass.
+
+        Args:
+            data: DataFrame with results
+            collective_stream_base: Base stream ID for collective streams
+            low_priority_stream_min: Minimum stream ID for low priority streams
+
+        Returns:
+            Tuple of (collective DataFrame, low priority DataFrame)
+        """
+        stream_id = data['stream_id'].to_numpy()
+        low_prio = stream_id >= low_priority_stream_min
+        coll = (stream_id > collective_stream_base) & ~low_prio
+        return data[coll], data[low_prio]
+
     def analyze_collective(self, data, collective_stream_base: int = 1000, low_priority_stream_min: int = 5000):
         """
         Analyze collective traffic (filter out background).
 
         Args:
-            data: List of dictionaries with results
+            data: DataFrame with results
             collective_stream_base: Base stream ID for collective streams
             low_priority_stream_min: Maximum stream ID for collective streams
 
@@ -168,7 +224,8 @@ class PreemptionAnalyzer:
             Dictionary with metrics including tail latencies
         """
         # Filter for collective streams only
-        coll_data = [row for row in data if collective_stream_base < row['stream_id'] < low_priority_stream_min]
+        stream_id = data['stream_id']
+        coll_data = data[(stream_id > collective_stream_base) & (stream_id < low_priority_stream_min)]
         return self._compute_flow_metrics(coll_data)
 
     def analyze_low_priority(self, data, low_priority_stream_min: int = 5000):
@@ -176,14 +233,14 @@ class PreemptionAnalyzer:
         Analyze low priority/background traffic.
 
         Args:
-            data: List of dictionaries with results
+            data: DataFrame with results
             low_priority_stream_min: Minimum stream ID for low priority streams
 
         Returns:
             Dictionary with metrics including tail latencies
         """
         # Filter for low priority streams only (stream_id >= 5000)
-        low_prio_data = [row for row in data if row['stream_id'] >= low_priority_stream_min]
+        low_prio_data = data[data['stream_id'] >= low_priority_stream_min]
         return self._compute_flow_metrics(low_prio_data)
 
     def compare_modes(self, collective: str):
@@ -194,23 +251,32 @@ class PreemptionAnalyzer:
             collective: 'all-to-all' or 'all-reduce'
 
         Returns:
-            Dictionary with comparison data
+            Dictionary with comparison data (cached; do not modify)
         """
+        if collective not in self._comparisons:
+            self._comparisons[collective] = self._compare_modes(collective)
+        return self._comparisons[collective]
+
+    def _compare_modes(self, collective: str):
+        """Load and analyze both modes for a collective (see compare_modes)."""
         # Load results
         data_protected = self.load_results('protected', collective)
         data_unprotected = self.load_results('unprotected', collective)
 
-        if not data_protected or not data_unprotected:
+        if data_protected.empty or data_unprotected.empty:
             print(f"Warning: Missing data for {collective}")
             return {}
 
+        coll_protected, low_protected = self._partition(data_protected)
+        coll_unprotected, low_unprotected = self._partition(data_unprotected)
+
         # Analyze both modes for collective flows
-        metrics_protected = self.analyze_collective(data_protected)
-        metrics_unprotected = self.analyze_collective(data_unprotected)
+        metrics_protected = self._compute_flow_metrics(coll_protected)
+        metrics_unprotected = self._compute_flow_metrics(coll_unprotected)
 
         # Analyze low priority flows
-        low_prio_protected = self.analyze_low_priority(data_protected)
-        low_prio_unprotected = self.analyze_low_priority(data_unprotected)
+        low_prio_protected = self._compute_flow_metrics(low_protected)
+        low_prio_unprotected = self._compute_flow_metrics(low_unprotected)
 
         return {
             'protected': metrics_protected,
@@ -234,6 +300,17 @@ class PreemptionAnalyzer:
             print(f"No data to plot for {collective}")
             return
 
+        self.plot_comparison_from(comparison, output_file)
+
+    def plot_comparison_from(self, comparison: dict, output_file: str):
+        """
+        Create comparison plots from a compare_modes() result.
+
+        Args:
+            comparison: Non-empty dictionary returned by compare_modes
+            output_file: Output PNG file path
+        """
+        collective = comparison['collective']
         metrics_prot = comparison['protected']
         metrics_unprot = comparison['unprotected']
         low_prio_prot = comparison['low_prio_protected']
@@ -363,13 +440,12 @@ class PreemptionAnalyzer:
         # Load data
         data = self.load_results(mode, collective)
 
-        if not data:
+        if data.empty:
             print(f"No data to plot for {mode} {collective}")
             return
 
         # Separate collective and low priority flows
-        coll_data = [row for row in data if 1000 < row['stream_id'] < 5000]
-        low_prio_data = [row for row in data if row['stream_id'] >= 5000]
+        coll_data, low_prio_data = self._partition(data)
 
         # Create figure with 2x2 subplots
         fig, axes = plt.subplots(2, 2, figsize=(16, 10))
@@ -378,13 +454,16 @@ class PreemptionAnalyzer:
                     fontsize=16, fontweight='bold')
 
         # Process collective flows
-        if coll_data:
-            coll_times = [float(row['arrival_time']) for row in coll_data if not row['dropped'] and row['arrival_time']]
-            coll_delays = [row['end_to_end_delay_ms'] for row in coll_data if not row['dropped'] and row['end_to_end_delay_ms']]
+        if not coll_data.empty:
+            delivered = ~coll_data['dropped'].to_numpy()
+            arrival = coll_data['arrival_time'].to_numpy()
+            delay = coll_data['end_to_end_delay_ms'].to_numpy()
+            coll_times = arrival[delivered & ~np.isnan(arrival)]
+            coll_delays = delay[delivered & (delay > 0)]
 
             # Plot 1: Collective Flow Delay Over Time
             ax1 = axes[0, 0]
-            if coll_times and coll_delays:
+            if coll_times.size and coll_delays.size:
                 ax1.scatter(coll_times, coll_delays, alpha=0.5, s=10, color='#3498db')
                 ax1.set_xlabel('Time (s)', fontweight='bold')
                 ax1.set_ylabel('Delay (ms)', fontweight='bold')
@@ -394,26 +473,22 @@ class PreemptionAnalyzer:
                 # Add moving average
                 window_size = max(1, len(coll_delays) // 50)
                 if len(coll_delays) >= window_size:
-                    moving_avg = []
-                    moving_times = []
-                    for i in range(len(coll_delays) - window_size + 1):
-                        moving_avg.append(sum(coll_delays[i:i+window_size]) / window_size)
-                        moving_times.append(coll_times[i + window_size // 2])
+                    moving_avg = np.convolve(coll_delays, np.ones(window_size), mode='valid') / window_size
+                    start = window_size // 2
+                    moving_times = coll_times[start:start + moving_avg.size]
                     ax1.plot(moving_times, moving_avg, color='red', linewidth=2, label='Moving Average')
                     ax1.legend()
 
             # Plot 2: Collective Flow Throughput Over Time
             ax2 = axes[0, 1]
-            if coll_times:
-                # Bin messages into time windows
-                time_bins = {}
+            if coll_times.size:
+                # Bin messages into time windows, keeping non-empty bins
                 bin_width = 0.1  # 100ms bins
-                for t in coll_times:
-                    bin_key = int(t / bin_width)
-                    time_bins[bin_key] = time_bins.get(bin_key, 0) + 1
+                counts = np.bincount((coll_times / bin_width).astype(np.int64))
+                bins = np.flatnonzero(counts)
 
-                bin_centers = [k * bin_width + bin_width/2 for k in sorted(time_bins.keys())]
-                throughputs = [time_bins[k] / bin_width for k in sorted(time_bins.keys())]  # messages per second
+                bin_centers = bins * bin_width + bin_width/2
+                throughputs = counts[bins] / bin_width  # messages per second
 
                 ax2.plot(bin_centers, throughputs, color='#2ecc71', linewidth=2)
                 ax2.fill_between(bin_centers, throughputs, alpha=0.3, color='#2ecc71')
@@ -423,13 +498,16 @@ class PreemptionAnalyzer:
                 ax2.grid(True, alpha=0.3)
 
         # Process low priority flows
-        if low_prio_data:
-            low_times = [float(row['arrival_time']) for row in low_prio_data if not row['dropped'] and row['arrival_time']]
-            low_delays = [row['end_to_end_delay_ms'] for row in low_prio_data if not row['dropped'] and row['end_to_end_delay_ms']]
+        if not low_prio_data.empty:
+            delivered = ~low_prio_data['dropped'].to_numpy()
+            arrival = low_prio_data['arrival_time'].to_numpy()
+            delay = low_prio_data['end_to_end_delay_ms'].to_numpy()
+            low_times = arrival[delivered & ~np.isnan(arrival)]
+            low_delays = delay[delivered & (delay > 0)]
 
             # Plot 3: Low Priority Flow Delay Over Time
             ax3 = axes[1, 0]
-            if low_times and low_delays:
+            if low_times.size and low_delays.size:
                 ax3.scatter(low_times, low_delays, alpha=0.5, s=10, color='#e67e22')
                 ax3.set_xlabel('Time (s)', fontweight='bold')
                 ax3.set_ylabel('Delay (ms)', fontweight='bold')
@@ -439,26 +517,22 @@ class PreemptionAnalyzer:
                 # Add moving average
                 window_size = max(1, len(low_delays) // 20)
                 if len(low_delays) >= window_size:
-                    moving_avg = []
-                    moving_times = []
-                    for i in range(len(low_delays) - window_size + 1):
-                        moving_avg.append(sum(low_delays[i:i+window_size]) / window_size)
-                        moving_times.append(low_times[i + window_size // 2])
+                    moving_avg = np.convolve(low_delays, np.ones(window_size), mode='valid') / window_size
+                    start = window_size // 2
+                    moving_times = low_times[start:start + moving_avg.size]
                     ax3.plot(moving_times, moving_avg, color='red', linewidth=2, label='Moving Average')
                     ax3.legend()
 
             # Plot 4: Low Priority Flow Throughput Over Time
             ax4 = axes[1, 1]
-            if low_times:
-                # Bin messages into time windows
-                time_bins = {}
+            if low_times.size:
+                # Bin messages into time windows, keeping non-empty bins
                 bin_width = 0.1  # 100ms bins
-                for t in low_times:
-                    bin_key = int(t / bin_width)
-                    time_bins[bin_key] = time_bins.get(bin_key, 0) + 1
+                counts = np.bincount((low_times / bin_width).astype(np.int64))
+                bins = np.flatnonzero(counts)
 
-                bin_centers = [k * bin_width + bin_width/2 for k in sorted(time_bins.keys())]
-                throughputs = [time_bins[k] / bin_width for k in sorted(time_bins.keys())]
+                bin_centers = bins * bin_width + bin_width/2
+                throughputs = counts[bins] / bin_width
 
                 ax4.plot(bin_centers, throughputs, color='#9b59b6', linewidth=2)
                 ax4.fill_between(bin_centers, throughputs, alpha=0.3, color='#9b59b6')
@@ -484,6 +558,16 @@ class PreemptionAnalyzer:
         if not comparison:
             return
 
+        self.print_summary_from(comparison)
+
+    def print_summary_from(self, comparison: dict):
+        """
+        Print text summary of a compare_modes() result.
+
+        Args:
+            comparison: Non-empty dictionary returned by compare_modes
+        """
+        collective = comparison['collective']
         metrics_prot = comparison['protected']
         metrics_unprot = comparison['unprotected']
         low_prio_prot = comparison['low_prio_protected']
@@ -590,6 +674,39 @@ class PreemptionAnalyzer:
         print("="*70 + "\n")
 
 
+def _run_job(analyzer, plots_dir: str, collective: str, mode: str = None):
+    """
+    Run one analysis job for a collective.
+
+    Args:
+        analyzer: PreemptionAnalyzer to use
+        plots_dir: Directory for the PNG files
+        collective: 'all-to-all' or 'all-reduce'
+        mode: None for the mode comparison (summary and comparison plot),
+            or 'protected'/'unprotected' for that mode's time series plot
+    """
+    if mode is None:
+        # Compare the modes once; the summary and comparison plot share it
+        comparison = analyzer.compare_modes(collective)
+        output_file = os.path.join(plots_dir, f"preemption_{collective}.png")
+        if comparison:
+            analyzer.print_summary_from(comparison)
+            analyzer.plot_comparison_from(comparison, output_file)
+        else:
+            print(f"No data to plot for {collective}")
+    else:
+        ts_output_file = os.path.join(plots_dir, f"timeseries_{mode}_{collective}.png")
+        analyzer.plot_time_series(mode, collective, ts_output_file)
+
+
+def _run_job_captured(results_dir: str, plots_dir: str, collective: str, mode: str = None):
+    """Run a job (see _run_job) with its own analyzer and return its printed output."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        _run_job(PreemptionAnalyzer(results_dir), plots_dir, collective, mode)
+    return output.getvalue()
+
+
 def main():
     """Analyze all preemption experiments and generate plots."""
     analyzer = PreemptionAnalyzer()
@@ -603,18 +720,26 @@ def main():
 
     collectives = ["all-to-all", "all-reduce"]
 
-    for collective in collectives:
-        # Print summary
-        analyzer.print_summary(collective)
-
-        # Generate comparison plot
-        output_file = os.path.join(plots_dir, f"preemption_{collective}.png")
-        analyzer.plot_comparison(collective, output_file)
-
-        # Generate time series plots for both modes
-        for mode in ['protected', 'unprotected']:
-            ts_output_file = os.path.join(plots_dir, f"timeseries_{mode}_{collective}.png")
-            analyzer.plot_time_series(mode, collective, ts_output_file)
+    # Per collective: the mode comparison, then time series plots for both
+    # modes. The jobs are independent, so with several CPUs on Linux they run
+    # in forked workers and their output is replayed in order; otherwise they
+    # run serially and share the analyzer's cached results. Fork is not used
+    # elsewhere: it is unsafe on macOS once numpy/pandas/matplotlib are loaded.
+    jobs = [(collective, mode) for collective in collectives
+            for mode in (None, 'protected', 'unprotected')]
+
+    # CPU budget from run_simulation.py --jobs (COLL_SIM_JOBS), else every CPU
+    workers = min(len(jobs), int(os.environ.get('COLL_SIM_JOBS') or os.cpu_count() or 1))
+    if workers > 1 and sys.platform == 'linux':
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('fork')) as executor:
+            futures = [executor.submit(_run_job_captured, analyzer.results_dir, plots_dir, *job)
+                       for job in jobs]
+            for future in futures:
+                print(future.result(), end="")
+    else:
+        for job in jobs:
+            _run_job(analyzer, plots_dir, *job)
 
     print("\n" + "="*70)
     print("ANALYSIS COMPLETE")
@@ -10,15 +10,16 @@ Compares frame preemption vs strict priority scheduling.
 
 import sys
 import os
+import pathlib
 
-# Add project paths
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
-sys.path.insert(0, PROJECT_ROOT)
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
-# Add priority stream simulator (in parent directory)
+# Add project paths (this file is three levels below the project root), plus
+# the priority stream simulator's parent directory. Already-present entries
+# are skipped so re-imports (e.g. in worker processes) don't grow sys.path.
+PROJECT_ROOT = str(pathlib.Path(__file__).resolve().parents[3])
 SIMULATOR_PATH = os.path.dirname(PROJECT_ROOT)
-sys.path.insert(0, SIMULATOR_PATH)
+for _path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src'), SIMULATOR_PATH):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 from priority_stream_simulator import Network, Link, Stream
 from collectives.patterns import CollectivePatterns
@@ -3,7 +3,8 @@ Collective Communication Patterns
 
 Implements common collective operations:
 - All-to-All: Each node sends to every other node
-- All-Reduce: Tree-based reduction then broadcast
+- All-Reduce: Tree-based reduction then broadcast, or Rabenseifner's
+  reduce-scatter + all-gather
 """
 
 import sys
@@ -84,11 +85,13 @@ class CollectivePatterns:
                    priority: int,
                    message_size_bytes: int = 1000,
                    interval_sec: float = 0.1,
-                   description: str = "All-Reduce") -> List[Stream]:
+                   description: str = "All-Reduce",
+                   algorithm: str = "tree") -> List[Stream]:
         """
         Generate All-Reduce communication pattern.
 
-        Implements tree-based all-reduce:
+        With algorithm="rabenseifner", see _rabenseifner_all_reduce.
+        Otherwise implements tree-based all-reduce:
         1. Reduce phase: Data flows up the tree to root
         2. Broadcast phase: Result flows down from root to all nodes
 
@@ -106,10 +109,17 @@ class CollectivePatterns:
             message_size_bytes: Size of each message
             interval_sec: Interval between messages
             description: Collective description
+            algorithm: "tree" (reduce to root + broadcast) or "rabenseifner"
 
         Returns:
             List of Stream objects representing the pattern
         """
+        if algorithm == "rabenseifner":
+            return self._rabenseifner_all_reduce(priority, message_size_bytes,
+                                                 interval_sec, description)
+        if algorithm != "tree":
+            raise ValueError(f"Unknown all-reduce algorithm: {algorithm}")
+
         streams = []
 
         # Phase 1: REDUCE - All nodes send to root (N0 chosen as logical root)
@@ -147,6 +157,60 @@ class CollectivePatterns:
               f"({self.num_nodes-1} reduce + {self.num_nodes-1} broadcast)")
         return streams
 
+    def _rabenseifner_all_reduce(self,
+                                 priority: int,
+                                 message_size_bytes: int,
+                                 interval_sec: float,
+                                 description: str) -> List[Stream]:
+        """
+        Generate Rabenseifner all-reduce: reduce-scatter then all-gather.
+
+        Reduce-scatter uses recursive halving: in step k every rank exchanges
+        with rank XOR 2^k and sends half of its remaining data (message/2,
+        /4, /8, ...). All-gather uses recursive doubling, replaying the steps
+        in reverse with growing chunks. Nearest partners (same rack for
+        rack-ordered node names) carry the largest chunks, so the farthest
+        exchange only carries message/N.
+
+        For 8 nodes: 3 reduce-scatter + 3 all-gather steps, 8 streams each.
+
+        Args:
+            priority: Priority level for all streams
+            message_size_bytes: Size of the full all-reduce message
+            interval_sec: Interval between messages
+            description: Collective description
+
+        Returns:
+            List of Stream objects representing the pattern
+        """
+        num_steps = self.num_nodes.bit_length() - 1
+        if self.num_nodes < 2 or self.num_nodes != 1 << num_steps:
+            raise ValueError(f"Rabenseifner all-reduce needs a power-of-two node count, got {self.num_nodes}")
+
+        # (phase, step, chunk size): halving chunks, then the same steps reversed
+        schedule = [("ReduceScatter", step, message_size_bytes >> (step + 1))
+                    for step in range(num_steps)]
+        schedule += [("AllGather", step, size) for _, step, size in reversed(schedule)]
+
+        streams = []
+        for phase, step, chunk_size in schedule:
+            for rank, src in enumerate(self.node_names):
+                dst = self.node_names[rank ^ (1 << step)]
+                stream = Stream(
+                    stream_id=self._get_stream_id(),
+                    priority=priority,
+                    src_node=src,
+                    dst_node=dst,
+                    message_interval_sec=interval_sec,
+                    message_size_bytes=max(chunk_size, 1),
+                    description=f"{description}-{phase}{step}: {src}->{dst}"
+                )
+                streams.append(stream)
+
+        print(f"All-Reduce (Rabenseifner): Generated {len(streams)} streams "
+              f"({num_steps} reduce-scatter + {num_steps} all-gather steps x {self.num_nodes} nodes)")
+        return streams
+
     def hierarchical_all_to_all(self,
                                  priority: int,
                                  message_size_bytes: int = 1000,
@@ -404,8 +468,38 @@ def test_collectives():
     print(f"   Expected: 7 reduce + 7 broadcast = 14 streams")
     print()
 
+    patterns.next_stream_id = 3000
+
+    # Test Rabenseifner All-Reduce
+    print("3. RABENSEIFNER ALL-REDUCE PATTERN")
+    print("-" * 70)
+    rab_streams = patterns.all_reduce(priority=7, message_size_bytes=1000,
+                                      algorithm="rabenseifner")
+    info = patterns.get_stream_info(rab_streams)
+    print(f"   Total streams: {info['total_streams']}")
+    print(f"   Expected: 3 reduce-scatter + 3 all-gather steps x 8 nodes = 48 streams")
+    assert info['total_streams'] == 48
+
+    # Each step pairs rank with rank XOR 2^step; chunks halve during
+    # reduce-scatter and the all-gather mirrors them in reverse
+    expected_steps = [(0, 500), (1, 250), (2, 125), (2, 125), (1, 250), (0, 500)]
+    for i, (step, size) in enumerate(expected_steps):
+        for rank, stream in enumerate(rab_streams[i * 8:(i + 1) * 8]):
+            assert stream.src_node == nodes[rank]
+            assert stream.dst_node == nodes[rank ^ (1 << step)]
+            assert stream.message_size_bytes == size
+    print(f"   Chunk sizes per step: {[size for _, size in expected_steps]}")
+
+    try:
+        CollectivePatterns(nodes[:6]).all_reduce(priority=7, algorithm="rabenseifner")
+    except ValueError as e:
+        print(f"   6 nodes rejected: {e}")
+    else:
+        raise AssertionError("Rabenseifner all-reduce accepted 6 nodes")
+    print()
+
     # Show sample streams
-    print("3. SAMPLE STREAMS")
+    print("4. SAMPLE STREAMS")
     print("-" * 70)
     print("All-to-All (first 5):")
     for stream in a2a_streams[:5]:
@@ -141,8 +141,13 @@ class PreemptiveSwitch(BaseSwitch):
                     self.network.track_dropped_message(message)
                     return
 
-        # Enqueue message in appropriate priority queue
-        self.priority_queue.enqueue(message, output_port)
+        # Enqueue message in appropriate priority queue (PriorityQueue.enqueue
+        # inlined on this per-packet path)
+        queue = self.priority_queue
+        priority = message.priority
+        queue.queues[priority].append((message, output_port))
+        queue.total_size += 1
+        queue.nonempty |= 1 << priority
 
         # Try to forward if not currently transmitting
         if not self.is_transmitting:
@@ -221,18 +226,22 @@ class PreemptiveSwitch(BaseSwitch):
             return
 
         # Priority 2: Forward from queue
-        if self.priority_queue.is_empty():
+        queue = self.priority_queue
+        nonempty = queue.nonempty
+        if not nonempty:
             self.is_transmitting = False
             return
 
         self.is_transmitting = True
-        result = self.priority_queue.dequeue()
 
-        if result is None:
-            self.is_transmitting = False
-            return
-
-        message, output_port = result
+        # Serve the highest non-empty priority level (PriorityQueue.dequeue
+        # inlined on this per-packet path)
+        priority = nonempty.bit_length() - 1
+        level = queue.queues[priority]
+        message, output_port = level.popleft()
+        if not level:
+            queue.nonempty = nonempty & ~(1 << priority)
+        queue.total_size -= 1
 
         # Get the output link
         link = self.output_links.get(output_port)
@@ -269,15 +278,15 @@ class PreemptiveSwitch(BaseSwitch):
         # Schedule message arrival at destination
         completion_event = self.network.schedule_event(
             completion_time,
-            lambda: self._complete_transmission(message, output_port, completion_time),
-            f"Message {message.msg_id} (stream {message.stream_id}, pri {message.priority}) arrives at {output_port}"
+            self._complete_transmission, (message, output_port, completion_time),
+            "Message {0.msg_id} (stream {0.stream_id}, pri {0.priority}) arrives at {1}"
         )
 
         # Schedule next forwarding attempt
         slot_event = self.network.schedule_event(
             link.busy_until,
-            lambda: self._transmission_slot_available(link.busy_until),
-            f"Switch {self.name} transmission slot available"
+            self._transmission_slot_available, (link,),
+            "Switch {owner.name} transmission slot available"
         )
 
         # Track current transmission with event handles
@@ -329,15 +338,15 @@ class PreemptiveSwitch(BaseSwitch):
         # Schedule message arrival (after resumption completes)
         completion_event = self.network.schedule_event(
             completion_time,
-            lambda: self._complete_transmission(message, output_port, completion_time),
-            f"Message {message.msg_id} (resumed) arrives at {output_port}"
+            self._complete_transmission, (message, output_port, completion_time),
+            "Message {0.msg_id} (resumed) arrives at {1}"
         )
 
         # Schedule next forwarding opportunity
         slot_event = self.network.schedule_event(
             link.busy_until,
-            lambda: self._transmission_slot_available(link.busy_until),
-            f"Switch {self.name} transmission slot available (after resume)"
+            self._transmission_slot_available, (link,),
+            "Switch {owner.name} transmission slot available (after resume)"
         )
 
         # Update current transmission (resuming) with event handles
@@ -371,17 +380,18 @@ class PreemptiveSwitch(BaseSwitch):
         # Deliver message
         self.network.deliver_message(message, output_port)
 
-    def _transmission_slot_available(self, current_time: float):
+    def _transmission_slot_available(self, link: Link):
         """
         Called when transmission slot becomes available.
 
         Args:
-            current_time: Current simulation time
+            link: Output link whose slot became available (its busy_until
+                is read when the event fires, as the current time)
         """
         # Mark as not transmitting and try to forward next
         self.current_transmission = None
         self.is_transmitting = False
-        self.forward_next_message(current_time)
+        self.forward_next_message(link.busy_until)
 
     def get_preemption_statistics(self) -> dict:
         """Get preemption-specific statistics."""